@@ -4,65 +4,229 @@ clean_runs.py
 
 Removes all pipeline run artifacts to provide a clean repository state.
 Keeps the directory structure but removes all run-specific data.
+
+Usage:
+    python clean_runs.py [--only TARGET ...] [--dry-run] [--verbose]
 """
 
+import argparse
+import os
 import shutil
-from pathlib import Path
-
-
-def clean_artifacts():
-    """Remove all run artifacts while preserving directory structure."""
-    repo_root = Path(__file__).resolve().parent
-    
-    # Directories to clean (remove all subdirectories with run IDs)
-    artifact_dirs = [
-        repo_root / "artifacts" / "bronze",
-        repo_root / "artifacts" / "silver", 
-        repo_root / "artifacts" / "gold" / "marts",
-        repo_root / "artifacts" / "orchestrator",
-        repo_root / "artifacts" / "reports"
-    ]
-    
-    # Temp directories to clean completely
-    temp_dirs = [
-        repo_root / "tmp"
-    ]
-    
-    files_removed = 0
-    dirs_removed = 0
-    
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+MAX_RMTREE_WORKERS = 16
+SUPPORTS_DIR_FD = os.unlink in os.supports_dir_fd and hasattr(os, "O_DIRECTORY")
+# Resolved once; shutil.rmtree (fd-based on POSIX) is the fallback when rm is unavailable
+RM_BINARY = shutil.which("rm") if sys.platform != "win32" else None
+
+REPO_ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# Directories to clean (remove all subdirectories with run IDs)
+ARTIFACT_DIRS = {
+    "bronze": os.path.join(REPO_ROOT, "artifacts", "bronze"),
+    "silver": os.path.join(REPO_ROOT, "artifacts", "silver"),
+    "gold": os.path.join(REPO_ROOT, "artifacts", "gold", "marts"),
+    "orchestrator": os.path.join(REPO_ROOT, "artifacts", "orchestrator"),
+    "reports": os.path.join(REPO_ROOT, "artifacts", "reports"),
+}
+
+# Temp directories to clean completely
+TEMP_DIRS = {"tmp": os.path.join(REPO_ROOT, "tmp")}
+
+# Bronze incremental-ingestion state
+STATE_DIR = os.path.join(REPO_ROOT, "artifacts", "bronze", "_state")
+
+CLEAN_TARGETS = (*ARTIFACT_DIRS, *TEMP_DIRS, "state")
+
+
+def _fast_rmtree(*paths):
+    """Remove directory trees, preferring a single native ``rm -rf`` on POSIX."""
+    if RM_BINARY:
+        try:
+            subprocess.run([RM_BINARY, "-rf", "--", *paths], check=True)
+            return
+        except (OSError, subprocess.CalledProcessError):
+            # Fall through to the portable implementation below.
+            pass
+    for path in paths:
+        try:
+            shutil.rmtree(path)
+        except FileNotFoundError:
+            pass
+
+
+def _rmtree_batches(paths):
+    """Group trees for removal: one ``rm`` call for all, else one task per tree."""
+    if not paths:
+        return []
+    if RM_BINARY:
+        return [list(paths)]
+    return [[path] for path in paths]
+
+
+def _unlink_in_dir(parent, names):
+    """Unlink files relative to an opened parent directory to skip path lookups."""
+    if not SUPPORTS_DIR_FD:
+        for name in names:
+            os.unlink(os.path.join(parent, name))
+        return
+    dir_fd = os.open(parent, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        for name in names:
+            os.unlink(name, dir_fd=dir_fd)
+    finally:
+        os.close(dir_fd)
+
+
+@dataclass
+class CleanupPlan:
+    """Paths found by the scan phase, grouped by how they are removed."""
+
+    dirs: List[str] = field(default_factory=list)
+    files: Dict[str, List[str]] = field(default_factory=dict)
+    paths: List[str] = field(default_factory=list)
+
+    @property
+    def file_count(self):
+        return sum(len(names) for names in self.files.values())
+
+
+def _plan_cleanup(only=None):
+    """Scan the selected targets and collect everything that should be removed."""
+    selected = set(only or CLEAN_TARGETS)
+    plan = CleanupPlan()
+
     # Clean artifact directories (keep structure, remove run folders)
-    for artifact_dir in artifact_dirs:
-        if artifact_dir.exists():
-            for run_dir in artifact_dir.iterdir():
-                if run_dir.is_dir() and not run_dir.name.startswith('.'):
-                    print(f"Removing: {run_dir}")
-                    shutil.rmtree(run_dir)
-                    dirs_removed += 1
-                elif run_dir.is_file() and not run_dir.name.startswith('.'):
-                    print(f"Removing: {run_dir}")
-                    run_dir.unlink()
-                    files_removed += 1
-    
+    for target, artifact_dir in ARTIFACT_DIRS.items():
+        if target not in selected:
+            continue
+        try:
+            entries = os.scandir(artifact_dir)
+        except FileNotFoundError:
+            continue
+        doomed_files = []
+        with entries:
+            for entry in entries:
+                name = entry.name
+                if name[:1] == '.':
+                    continue
+                path = entry.path
+                plan.paths.append(path)
+                if entry.is_dir(follow_symlinks=False):
+                    plan.dirs.append(path)
+                else:
+                    doomed_files.append(name)
+        if doomed_files:
+            plan.files[artifact_dir] = doomed_files
+
     # Clean temp directories completely
-    for temp_dir in temp_dirs:
-        if temp_dir.exists():
-            print(f"Removing temp directory: {temp_dir}")
-            shutil.rmtree(temp_dir)
-            dirs_removed += 1
-    
-    # Clean bronze state file
-    state_file = repo_root / "artifacts" / "bronze" / "_state" / "last_ingested.yaml"
-    if state_file.exists():
-        print(f"Removing state file: {state_file}")
-        state_file.unlink()
-        files_removed += 1
-    
+    for target, temp_dir in TEMP_DIRS.items():
+        if target in selected and os.path.isdir(temp_dir):
+            plan.paths.append(temp_dir)
+            plan.dirs.append(temp_dir)
+
+    # Clean bronze state files (already covered when the bronze run folders are removed)
+    if "state" in selected and STATE_DIR not in plan.dirs:
+        try:
+            with os.scandir(STATE_DIR) as entries:
+                state_files = [
+                    entry.name
+                    for entry in entries
+                    if not entry.name.startswith('.') and entry.is_file(follow_symlinks=False)
+                ]
+        except FileNotFoundError:
+            state_files = []
+        if state_files:
+            plan.files[STATE_DIR] = state_files
+            plan.paths.extend(os.path.join(STATE_DIR, name) for name in state_files)
+
+    return plan
+
+
+def _unlink_planned_files(plan):
+    """Remove the loose files of a plan, one opened parent directory at a time."""
+    for parent, names in plan.files.items():
+        _unlink_in_dir(parent, names)
+
+
+def _print_summary(plan, dry_run, verbose):
+    """Print removed paths (single write) and the cleanup totals."""
+    if (verbose or dry_run) and plan.paths:
+        prefix = "Would remove" if dry_run else "Removed"
+        sys.stdout.write("".join(f"{prefix}: {path}\n" for path in plan.paths))
+
+    if dry_run:
+        print("\nDry run complete, nothing was removed.")
+        print(f"   Directories to remove: {len(plan.dirs)}")
+        print(f"   Files to remove: {plan.file_count}")
+        return
+
     print(f"\n✅ Cleanup complete!")
-    print(f"   Directories removed: {dirs_removed}")
-    print(f"   Files removed: {files_removed}")
+    print(f"   Directories removed: {len(plan.dirs)}")
+    print(f"   Files removed: {plan.file_count}")
     print(f"   Repository is now clean for fresh runs.")
 
 
+def clean_artifacts(only=None, dry_run=False, verbose=False):
+    """Remove all run artifacts while preserving directory structure.
+
+    ``only`` restricts the cleanup to a subset of ``CLEAN_TARGETS``; unselected
+    directories are never scanned. With ``dry_run`` the same scan runs but
+    nothing is deleted and every matching path is listed. Removed paths are
+    otherwise only listed when ``verbose`` is set, in a single write after the
+    cleanup instead of one flush per entry.
+    """
+    plan = _plan_cleanup(only)
+    if not dry_run:
+        _unlink_planned_files(plan)
+        # Run folders are independent subtrees; without rm they are removed concurrently
+        batches = _rmtree_batches(plan.dirs)
+        if len(batches) == 1:
+            _fast_rmtree(*batches[0])
+        elif batches:
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(max_workers=min(MAX_RMTREE_WORKERS, len(batches))) as executor:
+                for future in [executor.submit(_fast_rmtree, *batch) for batch in batches]:
+                    future.result()
+    _print_summary(plan, dry_run, verbose)
+
+
+async def clean_artifacts_async(only=None, dry_run=False, verbose=False):
+    """Async variant of ``clean_artifacts`` for callers that already run an event loop.
+
+    Scanning and tree removal are dispatched with ``asyncio.to_thread`` so
+    the work shares the loop's default executor instead of a private pool.
+    """
+    # Imported lazily: asyncio dominates import time and the CLI never needs it
+    import asyncio
+
+    plan = await asyncio.to_thread(_plan_cleanup, only)
+    if not dry_run:
+        await asyncio.gather(
+            asyncio.to_thread(_unlink_planned_files, plan),
+            *(asyncio.to_thread(_fast_rmtree, *batch) for batch in _rmtree_batches(plan.dirs)),
+        )
+    _print_summary(plan, dry_run, verbose)
+
+
+def parse_args():
+    """Parse CLI arguments for the cleanup script."""
+    parser = argparse.ArgumentParser(description="Remove pipeline run artifacts.")
+    parser.add_argument(
+        "--only",
+        action="append",
+        choices=CLEAN_TARGETS,
+        help="Restrict the cleanup to this target (repeatable; default: all targets).",
+    )
+    parser.add_argument("--dry-run", action="store_true", help="List what would be removed without deleting.")
+    parser.add_argument("--verbose", action="store_true", help="List every removed path.")
+    return parser.parse_args()
+
+
 if __name__ == "__main__":
-    clean_artifacts()
\ No newline at end of file
+    args = parse_args()
+    clean_artifacts(only=args.only, dry_run=args.dry_run, verbose=args.verbose)
@@ -8,23 +8,89 @@ Target audience: Recruiters, business stakeholders, project sponsors
 Focus: Business value, ROI, strategic insights, not technical details
 """
 
+import hashlib
 import json
 import logging
 import os
+import shutil
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+import numpy as np
 import pandas as pd
 import yaml
-import matplotlib.pyplot as plt
-import seaborn as sns
 from dotenv import load_dotenv
-from openai import OpenAI
+from openai import APIError, OpenAI
 
 logger = logging.getLogger(__name__)
 
+# Upper bound for concurrent chat-completion requests (keeps us under RPM limits)
+MAX_CONCURRENT_LLM_CALLS = 6
+LLM_MAX_RETRIES = 3
+LLM_RETRY_BASE_DELAY_S = 1.0
+
+# Output budgets follow the word targets in the prompts instead of a flat ceiling.
+# ~2 tokens per word covers German text and markdown headings/tables (English prose
+# alone is ~1.35); the 1.5x margin keeps a long report from being cut mid-section,
+# which would fail the required-section check. Billing is per generated token, so
+# the headroom is free. Requests are also clamped to the model context window.
+OUTPUT_TOKENS_PER_WORD = 2.0
+OUTPUT_TOKEN_MARGIN = 1.5
+C_LEVEL_TEMPERATURE = 0.2
+C_LEVEL_MAX_TOKENS = int(750 * OUTPUT_TOKENS_PER_WORD * OUTPUT_TOKEN_MARGIN)
+TEAM_REPORT_TEMPERATURE = 0.3
+TEAM_REPORT_MAX_TOKENS = int(500 * OUTPUT_TOKENS_PER_WORD * OUTPUT_TOKEN_MARGIN)
+# Missing sections usually mean the first answer hit its cap; the fallback gets more room
+TEAM_REPORT_FALLBACK_MAX_TOKENS = 2 * TEAM_REPORT_MAX_TOKENS
+MODEL_CONTEXT_TOKENS = {"gpt-4.1": 1_047_576, "gpt-4o-mini": 128_000}
+CONTEXT_SAFETY_TOKENS = 64
+
+# Team reports are templated and go to a smaller model; incomplete answers (missing
+# sections) and prompts too long for the small model use the fallback model instead
+TEAM_REPORT_MODEL = "gpt-4o-mini"
+TEAM_REPORT_FALLBACK_MODEL = "gpt-4.1"
+TEAM_REPORT_SECTIONS = (
+    "## Scope & Objectives",
+    "## Key Insights for Your Department",
+    "## Implementation Actions",
+    "## Success Metrics",
+    "## Risks & Dependencies",
+)
+TEAM_REPORT_SMALL_MODEL_MAX_PROMPT_TOKENS = 100_000
+PROMPT_CHARS_PER_TOKEN = 4  # rough estimate, no tokenizer dependency
+
+# Analysis + chart cache for reruns on unchanged Gold inputs (ephemeral, under tmp/)
+INSIGHTS_CACHE_DIR = Path("tmp") / "cache" / "business_insights"
+
+# OpenAI Batch API (opt-in): half the token price, results within the completion window
+BATCH_COMPLETION_WINDOW = "24h"
+BATCH_POLL_INTERVAL_S = 30.0
+BATCH_TERMINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+# Chart rendering: one reusable Agg figure, pre-sized layouts instead of tight bbox/layout passes
+CHART_DPI = 150
+EXECUTIVE_KPIS_CHART = "executive_kpis_trend.png"
+PERFORMANCE_DASHBOARD_CHART = "business_performance_dashboard.png"
+# seaborn "husl" palette (6 colors), hardcoded so charts do not need seaborn
+CHART_PALETTE = ["#f77189", "#bb9832", "#50b131", "#36ada4", "#3ba3ec", "#e866f4"]
+
+# Gold CSV parsing: multithreaded pyarrow reader plus dtype hints for the projected columns.
+# The full KPI mart read in analyze_data_samples keeps the default engine: pyarrow would
+# parse date-like strings to timestamps, which break the JSON report payload.
+GOLD_CSV_ENGINE = "pyarrow"
+GOLD_COLUMN_DTYPES = {
+    "country": "category",
+    "gender": "category",
+    "category": "category",
+    "sales_amount": "float64",
+}
+
+@lru_cache(maxsize=None)
 def find_repo_root(start: Path) -> Path:
     cur = start.resolve()
     while cur != cur.parent:
@@ -48,7 +114,8 @@ def read_text(path: Path) -> str:
 def read_json(path: Path) -> Dict[str, Any]:
     if not path.exists():
         return {}
-    return json.loads(read_text(path))
+    # json.loads detects the UTF-8 encoding itself; skips the separate str decode step
+    return json.loads(path.read_bytes())
 
 def read_yaml(path: Path) -> Dict[str, Any]:
     if not path.exists():
@@ -56,21 +123,117 @@ def read_yaml(path: Path) -> Dict[str, Any]:
     with path.open("r", encoding="utf-8") as f:
         return yaml.safe_load(f) or {}
 
+def _stream_completion_to_file(client: OpenAI, output_path: Path, **request: Any) -> tuple[str, Any]:
+    """Stream a chat completion into ``output_path`` as tokens arrive; returns (content, usage)."""
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    stream = client.chat.completions.create(**request, stream=True, stream_options={"include_usage": True})
+    parts = []
+    usage = None
+    # Truncate on each attempt so a retry never appends to a partial answer
+    with output_path.open("w", encoding="utf-8") as f:
+        for chunk in stream:
+            if chunk.choices:
+                delta = chunk.choices[0].delta.content or ""
+                if delta:
+                    f.write(delta)
+                    f.flush()
+                    parts.append(delta)
+            if getattr(chunk, "usage", None):
+                usage = chunk.usage
+    return "".join(parts), usage
+
+def call_chat_completion(
+    client: OpenAI,
+    label: str,
+    *,
+    model_name: str,
+    messages: List[Dict[str, str]],
+    temperature: float,
+    max_tokens: int,
+    output_path: Optional[Path] = None,
+) -> tuple[str, Dict[str, int]]:
+    """Run one chat completion with exponential backoff on API errors.
+
+    With ``output_path`` the response is streamed and written to that file as
+    it arrives, so partial reports are visible (and survive crashes) early.
+    ``max_tokens`` is clamped to what the model context leaves after the
+    estimated prompt; prompts that do not fit fail before any API round-trip.
+    """
+    context_tokens = MODEL_CONTEXT_TOKENS.get(model_name)
+    if context_tokens:
+        prompt_tokens = estimate_prompt_tokens(messages)
+        available_tokens = context_tokens - prompt_tokens - CONTEXT_SAFETY_TOKENS
+        if available_tokens <= 0:
+            raise ValueError(f"{label} prompt (~{prompt_tokens} tokens) exceeds the {model_name} context window")
+        max_tokens = min(max_tokens, available_tokens)
+    request = {
+        "model": model_name,
+        "messages": messages,
+        "temperature": temperature,
+        "max_tokens": max_tokens,
+    }
+    for attempt in range(1, LLM_MAX_RETRIES + 1):
+        try:
+            start_time = time.time()
+            if output_path is None:
+                response = client.chat.completions.create(**request)
+                content = response.choices[0].message.content or ""
+                usage = getattr(response, "usage", None)
+            else:
+                content, usage = _stream_completion_to_file(client, output_path, **request)
+            break
+        except APIError as exc:
+            if attempt == LLM_MAX_RETRIES:
+                raise
+            sleep_s = LLM_RETRY_BASE_DELAY_S * (2 ** (attempt - 1))
+            logger.warning(f"{label} LLM call failed (attempt {attempt}/{LLM_MAX_RETRIES}): {exc}. Retrying in {sleep_s:.1f}s.")
+            time.sleep(sleep_s)
+    duration = time.time() - start_time
+
+    token_usage = {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0, "cached_tokens": 0}
+    if usage:
+        prompt_details = getattr(usage, "prompt_tokens_details", None)
+        token_usage = {
+            "prompt_tokens": usage.prompt_tokens,
+            "completion_tokens": usage.completion_tokens,
+            "total_tokens": usage.total_tokens,
+            # Prompt tokens served from OpenAI's prefix cache
+            "cached_tokens": getattr(prompt_details, "cached_tokens", None) or 0,
+        }
+
+    logger.info(f"{label} LLM call completed in {duration:.2f}s, tokens: {token_usage}")
+
+    return content.strip(), token_usage
+
+def read_gold_columns(path: Path, columns: List[str]) -> pd.DataFrame:
+    """Read only the requested columns of a Gold CSV (always keeping row count intact)."""
+    header = pd.read_csv(path, nrows=0).columns
+    wanted = set(columns)
+    usecols = [col for col in header if col in wanted] or list(header[:1])
+    dtype = {col: GOLD_COLUMN_DTYPES[col] for col in usecols if col in GOLD_COLUMN_DTYPES}
+    return pd.read_csv(path, usecols=usecols, dtype=dtype or None, engine=GOLD_CSV_ENGINE)
+
 def create_business_charts(gold_data_dir: Path, charts_dir: Path) -> List[str]:
     """Create C-Level business charts using actual Gold layer data."""
+    # Imported lazily: matplotlib is only needed on a chart cache miss
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+    from matplotlib.ticker import FuncFormatter
+    
     charts_dir.mkdir(exist_ok=True)
     chart_files = []
     
-    plt.style.use('default')
-    sns.set_palette("husl")
+    fig = Figure(dpi=CHART_DPI, facecolor='white')
+    canvas = FigureCanvasAgg(fig)
     
     try:
         # 1. Executive KPIs Trend Chart - Use actual KPI data
         kpi_file = gold_data_dir / "gold_agg_exec_kpis.csv"
         if kpi_file.exists():
-            df = pd.read_csv(kpi_file)
+            df = read_gold_columns(kpi_file, ["customer_segment", "total_sales", "customer_count"])
             if not df.empty and 'customer_segment' in df.columns:
-                fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 6))
+                fig.set_size_inches(14, 6)
+                ax1, ax2 = fig.subplots(1, 2)
                 
                 # Revenue by segment
                 if 'total_sales' in df.columns:
@@ -80,7 +243,7 @@ def create_business_charts(gold_data_dir: Path, charts_dir: Path) -> List[str]:
                     ax1.set_title('Revenue by Customer Segment', fontsize=16, fontweight='bold', pad=20)
                     ax1.set_ylabel('Revenue (€)', fontsize=12)
                     ax1.grid(True, alpha=0.3)
-                    ax1.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'€{x:,.0f}'))
+                    ax1.yaxis.set_major_formatter(FuncFormatter(lambda x, p: f'€{x:,.0f}'))
                     
                     # Add value labels on bars
                     for i, v in enumerate(sales):
@@ -98,20 +261,21 @@ def create_business_charts(gold_data_dir: Path, charts_dir: Path) -> List[str]:
                     for i, v in enumerate(customers):
                         ax2.text(i, v + v*0.01, f'{v:,}', ha='center', va='bottom', fontweight='bold')
                 
-                plt.tight_layout()
-                chart_path = charts_dir / "executive_kpis_trend.png"
-                plt.savefig(chart_path, dpi=300, bbox_inches='tight', facecolor='white')
-                plt.close()
+                fig.subplots_adjust(left=0.1, right=0.98, bottom=0.1, top=0.88, wspace=0.25)
+                chart_path = charts_dir / EXECUTIVE_KPIS_CHART
+                canvas.print_png(chart_path)
+                fig.clear()
                 chart_files.append(chart_path.name)
                 logger.info(f"Created executive KPIs chart with {len(df)} segments")
         
         # 2. Business Performance Dashboard - Use actual business data
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(14, 10))
+        fig.set_size_inches(14, 10)
+        (ax1, ax2), (ax3, ax4) = fig.subplots(2, 2)
         
         # Customer segmentation from actual data
         customer_file = gold_data_dir / "gold_dim_customer.csv"
         if customer_file.exists():
-            df_customers = pd.read_csv(customer_file)
+            df_customers = read_gold_columns(customer_file, ["country"])
             if 'country' in df_customers.columns:
                 top_countries = df_customers['country'].value_counts().head(5)
                 ax1.bar(top_countries.index, top_countries.values, color='#4682B4', alpha=0.8)
@@ -122,35 +286,34 @@ def create_business_charts(gold_data_dir: Path, charts_dir: Path) -> List[str]:
         # Product performance from actual data
         product_file = gold_data_dir / "gold_dim_product.csv"
         if product_file.exists():
-            df_products = pd.read_csv(product_file)
+            df_products = read_gold_columns(product_file, ["category"])
             if 'category' in df_products.columns:
                 categories = df_products['category'].value_counts().head(6)
-                ax2.pie(categories.values, labels=categories.index, autopct='%1.1f%%', startangle=90)
+                ax2.pie(categories.values, labels=categories.index, colors=CHART_PALETTE, autopct='%1.1f%%', startangle=90)
                 ax2.set_title('Product Portfolio Distribution', fontweight='bold', fontsize=14)
         
         # Sales performance from actual data
         sales_file = gold_data_dir / "gold_fact_sales.csv"
         if sales_file.exists():
-            df_sales = pd.read_csv(sales_file)
+            df_sales = read_gold_columns(sales_file, ["sales_amount"])
             if 'sales_amount' in df_sales.columns:
                 # Sales distribution histogram
                 ax3.hist(df_sales['sales_amount'], bins=20, alpha=0.7, color='#2E8B57', edgecolor='black')
                 ax3.set_title('Transaction Value Distribution', fontweight='bold', fontsize=14)
                 ax3.set_xlabel('Transaction Amount (€)')
                 ax3.set_ylabel('Frequency')
-                ax3.xaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'€{x:,.0f}'))
+                ax3.xaxis.set_major_formatter(FuncFormatter(lambda x, p: f'€{x:,.0f}'))
         
         # Business metrics summary
         metrics = ['Revenue', 'Customers', 'Products', 'Transactions']
         values = [0, 0, 0, 0]
         
-        # Get actual counts
+        # Get actual counts (reusing the frames loaded above)
         if customer_file.exists():
-            values[1] = len(pd.read_csv(customer_file))
+            values[1] = len(df_customers)
         if product_file.exists():
-            values[2] = len(pd.read_csv(product_file))
+            values[2] = len(df_products)
         if sales_file.exists():
-            df_sales = pd.read_csv(sales_file)
             values[3] = len(df_sales)
             if 'sales_amount' in df_sales.columns:
                 values[0] = df_sales['sales_amount'].sum()
@@ -169,10 +332,10 @@ def create_business_charts(gold_data_dir: Path, charts_dir: Path) -> List[str]:
                 ax4.text(bar.get_x() + bar.get_width()/2., height + height*0.01,
                         f'{value:,}', ha='center', va='bottom', fontweight='bold')
         
-        plt.tight_layout()
-        chart_path = charts_dir / "business_performance_dashboard.png"
-        plt.savefig(chart_path, dpi=300, bbox_inches='tight', facecolor='white')
-        plt.close()
+        fig.subplots_adjust(left=0.08, right=0.98, bottom=0.08, top=0.95, wspace=0.25, hspace=0.4)
+        chart_path = charts_dir / PERFORMANCE_DASHBOARD_CHART
+        canvas.print_png(chart_path)
+        fig.clear()
         chart_files.append(chart_path.name)
         logger.info("Created business performance dashboard")
         
@@ -198,51 +361,72 @@ def analyze_data_samples(gold_data_dir: Path) -> Dict[str, Any]:
     }
     
     try:
+        # One directory read answers every "is this mart present?" check below
+        try:
+            with os.scandir(gold_data_dir) as entries:
+                existing = {entry.name for entry in entries if entry.is_file()}
+        except FileNotFoundError:
+            existing = set()
+        
         # Customer dimension analysis
         customer_file = gold_data_dir / "gold_dim_customer.csv"
-        if customer_file.exists():
-            df = pd.read_csv(customer_file)
+        found_customer = customer_file.name in existing
+        if found_customer:
+            df = read_gold_columns(customer_file, ["country", "gender"])
             insights["total_customers"] = len(df)
             if "country" in df.columns:
+                # One value_counts pass (NaN excluded, sorted) serves all three metrics
+                country_counts = df["country"].value_counts()
                 insights["geographic_coverage"] = {
-                    "countries_covered": df["country"].nunique(),
-                    "top_markets": df["country"].value_counts().head(5).to_dict(),
-                    "market_concentration": f"{(df['country'].value_counts().iloc[0] / len(df) * 100):.1f}%"
+                    "countries_covered": len(country_counts),
+                    "top_markets": country_counts.head(5).to_dict(),
+                    "market_concentration": f"{(country_counts.iloc[0] / len(df) * 100):.1f}%"
                 }
             if "gender" in df.columns:
                 insights["customer_segments"]["gender_split"] = df["gender"].value_counts().to_dict()
         
         # Product dimension analysis
         product_file = gold_data_dir / "gold_dim_product.csv"
-        if product_file.exists():
-            df = pd.read_csv(product_file)
+        found_product = product_file.name in existing
+        if found_product:
+            df = read_gold_columns(product_file, ["category"])
             insights["total_products"] = len(df)
             if "category" in df.columns:
+                category_counts = df["category"].value_counts()
                 insights["product_performance"] = {
-                    "categories_count": df["category"].nunique(),
-                    "category_distribution": df["category"].value_counts().head(5).to_dict()
+                    "categories_count": len(category_counts),
+                    "category_distribution": category_counts.head(5).to_dict()
                 }
         
         # Sales fact analysis
         sales_file = gold_data_dir / "gold_fact_sales.csv"
-        if sales_file.exists():
-            df = pd.read_csv(sales_file)
+        found_sales = sales_file.name in existing
+        if found_sales:
+            df = read_gold_columns(sales_file, ["sales_amount"])
             insights["total_sales_records"] = len(df)
             if "sales_amount" in df.columns:
+                amounts = df["sales_amount"].to_numpy(dtype=float)
+                amounts = amounts[~np.isnan(amounts)]
+                total_revenue = float(amounts.sum())
+                if amounts.size:
+                    avg_transaction, max_transaction, q80 = amounts.mean(), amounts.max(), np.quantile(amounts, 0.8)
+                else:
+                    avg_transaction = max_transaction = q80 = np.float64("nan")
                 insights["revenue_metrics"] = {
-                    "total_revenue": float(df["sales_amount"].sum()),
-                    "avg_transaction_value": float(df["sales_amount"].mean()),
-                    "max_transaction": float(df["sales_amount"].max()),
-                    "revenue_concentration": f"{(df['sales_amount'].quantile(0.8) / df['sales_amount'].sum() * 100):.1f}%"
+                    "total_revenue": total_revenue,
+                    "avg_transaction_value": float(avg_transaction),
+                    "max_transaction": float(max_transaction),
+                    "revenue_concentration": f"{(q80 / total_revenue * 100):.1f}%"
                 }
         
         # Executive KPIs analysis
         kpi_file = gold_data_dir / "gold_agg_exec_kpis.csv"
-        if kpi_file.exists():
+        found_kpi = kpi_file.name in existing
+        if found_kpi:
             df = pd.read_csv(kpi_file)
             if not df.empty:
                 insights["business_kpis"] = {
-                    "monthly_trends": df.to_dict("records")[:6],  # Last 6 months
+                    "monthly_trends": df.head(6).to_dict("records"),  # Last 6 months
                     "growth_rate": "TBD",  # Calculate month-over-month
                     "seasonality": "Detected" if df["total_sales"].std() > df["total_sales"].mean() * 0.2 else "Minimal"
                 }
@@ -256,12 +440,7 @@ def analyze_data_samples(gold_data_dir: Path) -> Dict[str, Any]:
         }
         
         # Calculate overall data quality score
-        files_found = sum([
-            customer_file.exists(),
-            product_file.exists(), 
-            sales_file.exists(),
-            kpi_file.exists()
-        ])
+        files_found = sum([found_customer, found_product, found_sales, found_kpi])
         insights["data_quality_score"] = (files_found / 4) * 100
         
         # Business confidence indicators
@@ -277,100 +456,389 @@ def analyze_data_samples(gold_data_dir: Path) -> Dict[str, Any]:
     
     return insights
 
-def generate_c_level_report(
-    client: OpenAI,
-    run_id: str,
-    pipeline_summary: Dict[str, Any],
-    data_insights: Dict[str, Any],
-    chart_files: List[str] = None,
-    model_name: str = "gpt-4.1"
-) -> tuple[str, Dict[str, int]]:
-    """Generate C-Level executive report - business focused, no technical jargon."""
+def gold_inputs_fingerprint(gold_data_dir: Path) -> str:
+    """Hash the Gold CSV names, sizes and mtimes; any input change yields a new key."""
+    entries = []
+    if gold_data_dir.exists():
+        for path in sorted(gold_data_dir.glob("*.csv")):
+            stat = path.stat()
+            entries.append([path.name, stat.st_size, stat.st_mtime_ns])
+    payload = json.dumps([str(gold_data_dir.resolve()), entries])
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+def expected_chart_files(gold_data_dir: Path) -> List[str]:
+    """Chart names create_business_charts produces for the Gold marts present (used before rendering ends)."""
+    chart_files = []
+    kpi_file = gold_data_dir / "gold_agg_exec_kpis.csv"
+    if kpi_file.exists() and "customer_segment" in pd.read_csv(kpi_file, nrows=0).columns:
+        chart_files.append(EXECUTIVE_KPIS_CHART)
+    chart_files.append(PERFORMANCE_DASHBOARD_CHART)
+    return chart_files
+
+def _render_and_cache_charts(
+    gold_data_dir: Path,
+    charts_dir: Path,
+    cache_dir: Path,
+    data_insights: Dict[str, Any]
+) -> List[str]:
+    chart_files = create_business_charts(gold_data_dir, charts_dir)
+    if "analysis_error" in data_insights:
+        return chart_files
     
-    system_msg = {
-        "role": "system",
-        "content": (
-            "You are a Senior Principal Executive Reporting & Analytics Architect. "
-            "Create a C-Level executive report focused on business outcomes, risk, and decisions. "
-            "Use NO technical jargon. Focus on business impact, ROI, and strategic value. "
-            "Be evidence-first, audit-ready, and non-speculative. German/DACH business friendly."
+    try:
+        (cache_dir / "charts").mkdir(parents=True, exist_ok=True)
+        for name in chart_files:
+            shutil.copy2(charts_dir / name, cache_dir / "charts" / name)
+        (cache_dir / "insights.json").write_text(
+            json.dumps({"data_insights": data_insights, "chart_files": chart_files}, indent=2, ensure_ascii=False),
+            encoding="utf-8"
         )
-    }
+    except OSError as exc:
+        logger.warning(f"Could not write business insights cache: {exc}")
+    return chart_files
+
+def start_insights_build(
+    gold_data_dir: Path,
+    charts_dir: Path,
+    cache_root: Path,
+    executor: ThreadPoolExecutor
+) -> tuple[Dict[str, Any], "Future[List[str]]"]:
+    """Return data insights now and a future for the chart files.
     
-    user_msg = {
-        "role": "user",
-        "content": (
-            "Create a C-Level Executive Business Report from this data pipeline execution. "
-            "HARD RULES: Evidence-first only, no technical terms, business language only.\n\n"
-            f"Pipeline Run ID: {run_id}\n"
-            f"Charts available: {', '.join(chart_files) if chart_files else 'None'}\n\n"
-            "Data Insights:\n"
-            f"{json.dumps(data_insights, indent=2)}\n\n"
-            "Pipeline Summary:\n"
-            f"{json.dumps(pipeline_summary, indent=2)}\n\n"
-            "Create report with these sections (450-750 words total):\n\n"
-            "# C-LEVEL EXECUTIVE BUSINESS REPORT\n\n"
-            "## Executive Summary (5 bullets max)\n"
-            "- What this enables for the business\n"
-            "- What was delivered (concrete outcomes)\n"
-            "- Why it matters (business impact) - NO fabricated numbers\n"
-            "- Risk assessment (data quality, operational risk)\n"
-            "- Decision needed from leadership\n\n"
-            "## Problem & Context\n"
-            "- Business challenge addressed\n"
-            "- Stakeholders impacted\n"
-            "- Success criteria\n\n"
-            "## Solution Overview\n"
-            "- What the solution does (business terms only)\n"
-            "- How it creates value\n\n"
-            "## Outcomes & Proof\n"
-            "- List 3-6 concrete business outcomes\n"
-            "- Each with evidence from the data\n\n"
-            "## Risks & Controls\n"
-            "- Data quality controls in place\n"
-            "- Operational risks identified\n"
-            "- Compliance posture\n\n"
-            "## Next Actions (30-60 days)\n"
-            "- 3-7 prioritized business actions\n"
-            "- Each linked to specific opportunity\n\n"
-            "Use business language only. No technical terms like 'pipeline', 'ETL', 'Bronze/Silver/Gold'."
-        )
-    }
+    Unchanged Gold inputs are served from the cache; otherwise the analysis runs
+    inline (the LLM prompts need it) while chart rendering is submitted to
+    ``executor`` so it overlaps with the LLM calls.
+    """
+    cache_dir = cache_root / gold_inputs_fingerprint(gold_data_dir)
+    cache_file = cache_dir / "insights.json"
+    if cache_file.exists():
+        cached = read_json(cache_file)
+        chart_files = cached.get("chart_files", [])
+        charts_dir.mkdir(parents=True, exist_ok=True)
+        for name in chart_files:
+            shutil.copy2(cache_dir / "charts" / name, charts_dir / name)
+        logger.info(f"Reusing cached business insights from {cache_dir}")
+        charts_future: Future = Future()
+        charts_future.set_result(chart_files)
+        return cached.get("data_insights", {}), charts_future
     
-    start_time = time.time()
-    response = client.chat.completions.create(
-        model=model_name,
-        messages=[system_msg, user_msg],
-        temperature=0.2,
-        max_tokens=2000
+    data_insights = analyze_data_samples(gold_data_dir)
+    charts_future = executor.submit(_render_and_cache_charts, gold_data_dir, charts_dir, cache_dir, data_insights)
+    return data_insights, charts_future
+
+def load_or_build_insights(
+    gold_data_dir: Path,
+    charts_dir: Path,
+    cache_root: Path
+) -> tuple[Dict[str, Any], List[str]]:
+    """Return data insights and chart files, reusing a cached result for unchanged Gold inputs."""
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        data_insights, charts_future = start_insights_build(gold_data_dir, charts_dir, cache_root, executor)
+        return data_insights, charts_future.result()
+
+C_LEVEL_SYSTEM_PROMPT = (
+    "You are a Senior Principal Executive Reporting & Analytics Architect. "
+    "Create a C-Level executive report focused on business outcomes, risk, and decisions. "
+    "Use NO technical jargon. Focus on business impact, ROI, and strategic value. "
+    "Be evidence-first, audit-ready, and non-speculative. German/DACH business friendly."
+)
+
+C_LEVEL_USER_TEMPLATE = (
+    "Create a C-Level Executive Business Report from this data pipeline execution. "
+    "HARD RULES: Evidence-first only, no technical terms, business language only.\n\n"
+    "Pipeline Run ID: {run_id}\n"
+    "Charts available: {charts}\n\n"
+    "Data Insights:\n"
+    "{insights_json}\n\n"
+    "Pipeline Summary:\n"
+    "{summary_json}\n\n"
+    "Create report with these sections (450-750 words total):\n\n"
+    "# C-LEVEL EXECUTIVE BUSINESS REPORT\n\n"
+    "## Executive Summary (5 bullets max)\n"
+    "- What this enables for the business\n"
+    "- What was delivered (concrete outcomes)\n"
+    "- Why it matters (business impact) - NO fabricated numbers\n"
+    "- Risk assessment (data quality, operational risk)\n"
+    "- Decision needed from leadership\n\n"
+    "## Problem & Context\n"
+    "- Business challenge addressed\n"
+    "- Stakeholders impacted\n"
+    "- Success criteria\n\n"
+    "## Solution Overview\n"
+    "- What the solution does (business terms only)\n"
+    "- How it creates value\n\n"
+    "## Outcomes & Proof\n"
+    "- List 3-6 concrete business outcomes\n"
+    "- Each with evidence from the data\n\n"
+    "## Risks & Controls\n"
+    "- Data quality controls in place\n"
+    "- Operational risks identified\n"
+    "- Compliance posture\n\n"
+    "## Next Actions (30-60 days)\n"
+    "- 3-7 prioritized business actions\n"
+    "- Each linked to specific opportunity\n\n"
+    "Use business language only. No technical terms like 'pipeline', 'ETL', 'Bronze/Silver/Gold'."
+)
+
+# Team reports are identical up to the trailing department/run block, so after the
+# first department the shared prefix is served from OpenAI's prompt cache.
+TEAM_REPORT_SYSTEM_PROMPT = (
+    "You are a Senior Analytics Architect creating department team reports. "
+    "Focus on implementation, operations, and actionable next steps. "
+    "Use technical terms appropriately for the target department. Be evidence-first and concrete."
+)
+
+TEAM_REPORT_USER_TEMPLATE = (
+    "Charts available: {charts}\n\n"
+    "Data Insights:\n"
+    "{insights_json}\n\n"
+    "Create a Team Implementation Report from this data analysis for the department "
+    "named at the end of this message.\n\n"
+    "Create report with these sections (300-500 words):\n\n"
+    "# <DEPARTMENT> TEAM REPORT (department name in upper case)\n\n"
+    "## Scope & Objectives\n"
+    "- What the department can now do with this data\n"
+    "- Specific capabilities enabled\n\n"
+    "## Key Insights for Your Department\n"
+    "- Data points most relevant to the department\n"
+    "- Actionable insights with evidence\n\n"
+    "## Implementation Actions\n"
+    "- Specific steps your team should take\n"
+    "- Priority order and timelines\n\n"
+    "## Success Metrics\n"
+    "- How the department should measure success\n"
+    "- KPIs to track\n\n"
+    "## Risks & Dependencies\n"
+    "- What could impact the department's success\n"
+    "- Dependencies on other teams\n\n"
+    "Focus on what the department's teams need to know and do. Use appropriate technical depth.\n\n"
+    "---\n"
+    "Department: {dept}\n"
+    "Run: {run_id}\n"
+)
+
+BUSINESS_REPORT_SYSTEM_PROMPT = (
+    "You are a senior management consultant creating C-Level business reports. "
+    "Your audience is executives, board members, and business stakeholders who need "
+    "decision-ready insights with clear ROI and actionable recommendations. "
+    "Focus on business impact, not technical details. Use professional, executive language."
+)
+
+BUSINESS_REPORT_USER_TEMPLATE = (
+    "Create a C-Level business report from this data pipeline execution. "
+    "Follow the enterprise template structure exactly.\n\n"
+    "Charts available: {charts}\n\n"
+    "Technical Pipeline Summary:\n"
+    "----------------------------\n"
+    "{summary_json}\n\n"
+    "Business Data Insights:\n"
+    "----------------------\n"
+    "{insights_json}\n\n"
+    "Create a professional C-Level report with these sections:\n\n"
+    "# 1. MANAGEMENT SNAPSHOT\n"
+    "- Report title: 'Data Analytics Pipeline - Business Impact Assessment'\n"
+    "- Data as of: [current date]\n"
+    "- Target audience: C-Level Executives, Business Stakeholders\n"
+    "- **1-sentence thesis** (core business value)\n"
+    "- **Top 3 findings** (with numbers)\n"
+    "- **Top 3 recommendations** (actionable)\n"
+    "- **Expected business impact** (quantified)\n"
+    "- **Data confidence level** (High/Medium/Low)\n\n"
+    "# 2. EXECUTIVE SUMMARY\n"
+    "- **Why now?** Business context and opportunity\n"
+    "- **What was analyzed?** Data scope and systems\n"
+    "- **Key insights** (3-5 bullets with metrics)\n"
+    "- **So what?** Impact on revenue, costs, customer satisfaction\n"
+    "- **Now what?** Priority recommendations\n"
+    "- **Resource requirements** (budget, timeline, dependencies)\n\n"
+    "# 3. BUSINESS CONTEXT & OBJECTIVES\n"
+    "- Current market situation and internal triggers\n"
+    "- Business goals enabled by data analytics\n"
+    "- Key business questions answered\n"
+    "- Success criteria and KPIs\n\n"
+    "# 4. DATA SCOPE & ASSUMPTIONS\n"
+    "- Data sources: CRM, ERP systems\n"
+    "- Coverage: customers, products, transactions, locations\n"
+    "- Time period and data quality\n"
+    "- Key assumptions and limitations\n\n"
+    "# 5. KEY FINDINGS (Decision-Oriented)\n"
+    "For each finding provide:\n"
+    "- **Insight** (1 sentence)\n"
+    "- **Evidence** (specific numbers)\n"
+    "- **Business impact** (revenue, cost, risk)\n"
+    "- **Root cause** (why this matters)\n"
+    "- **Action opportunity** (what can be done)\n"
+    "- **Chart reference** (if applicable: one of the charts available listed above)\n\n"
+    "Focus on:\n"
+    "- Customer segmentation and value\n"
+    "- Product performance and optimization\n"
+    "- Revenue trends and drivers\n"
+    "- Operational efficiency gains\n\n"
+    "# 6. FINANCIAL IMPACT & VALUE CASE\n"
+    "- Baseline vs. target state\n"
+    "- Value potential (conservative/expected/optimistic)\n"
+    "- ROI from data-driven decisions\n"
+    "- Cost savings from automation\n\n"
+    "# 7. STRATEGIC RECOMMENDATIONS\n"
+    "For each recommendation:\n"
+    "- **Initiative title**\n"
+    "- **Business outcome** (KPI target)\n"
+    "- **Specific actions** (3-5 steps)\n"
+    "- **Owner** (business function)\n"
+    "- **Effort level** (S/M/L)\n"
+    "- **Expected impact** (quantified)\n"
+    "- **Timeline** (Quick win vs. long-term)\n\n"
+    "# 8. IMPLEMENTATION ROADMAP\n"
+    "- 30-60-90 day plan\n"
+    "- Quick wins vs. strategic initiatives\n"
+    "- Key milestones and deliverables\n"
+    "- Success metrics and tracking\n\n"
+    "# 9. RISKS & GOVERNANCE\n"
+    "- Top business risks\n"
+    "- Data governance and compliance\n"
+    "- Quality controls and monitoring\n"
+    "- Ownership and accountability\n\n"
+    "Use specific numbers from the data. Focus on business outcomes, not technical processes. "
+    "Make every section actionable for executives."
+)
+
+
+@dataclass(frozen=True)
+class ReportInputs:
+    """Prompt inputs shared by every report call; the JSON blocks are serialized once.
+
+    Keys are sorted so identical inputs always yield byte-identical prompts.
+    """
+
+    run_id: str
+    pipeline_summary: Dict[str, Any]
+    data_insights: Dict[str, Any]
+    chart_files: Optional[List[str]] = None
+
+    @cached_property
+    def insights_json(self) -> str:
+        return json.dumps(self.data_insights, indent=2, ensure_ascii=False, sort_keys=True)
+
+    @cached_property
+    def summary_json(self) -> str:
+        return json.dumps(self.pipeline_summary, indent=2, ensure_ascii=False, sort_keys=True)
+
+    @property
+    def charts(self) -> str:
+        return ', '.join(self.chart_files) if self.chart_files else 'None'
+
+
+def build_c_level_messages(inputs: ReportInputs) -> List[Dict[str, str]]:
+    """Build the chat messages for the C-Level executive report."""
+    user_content = C_LEVEL_USER_TEMPLATE.format(
+        run_id=inputs.run_id,
+        charts=inputs.charts,
+        insights_json=inputs.insights_json,
+        summary_json=inputs.summary_json
     )
-    duration = time.time() - start_time
-    
-    token_usage = {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
-    if hasattr(response, 'usage') and response.usage:
-        token_usage = {
-            "prompt_tokens": response.usage.prompt_tokens,
-            "completion_tokens": response.usage.completion_tokens,
-            "total_tokens": response.usage.total_tokens,
-        }
-    
-    logger.info(f"C-Level report LLM call completed in {duration:.2f}s, tokens: {token_usage}")
+    return [
+        {"role": "system", "content": C_LEVEL_SYSTEM_PROMPT},
+        {"role": "user", "content": user_content},
+    ]
+
+
+def generate_c_level_report(
+    client: OpenAI,
+    inputs: ReportInputs,
+    model_name: str = "gpt-4.1",
+    output_path: Optional[Path] = None
+) -> tuple[str, Dict[str, int]]:
+    """Generate C-Level executive report - business focused, no technical jargon."""
     
-    content = response.choices[0].message.content or ""
-    return content.strip(), token_usage
+    return call_chat_completion(
+        client,
+        "C-Level report",
+        model_name=model_name,
+        messages=build_c_level_messages(inputs),
+        temperature=C_LEVEL_TEMPERATURE,
+        max_tokens=C_LEVEL_MAX_TOKENS,
+        output_path=output_path
+    )
 
 
-def generate_team_reports(
+def build_team_report_messages(dept: str, inputs: ReportInputs) -> List[Dict[str, str]]:
+    """Build the chat messages for one department team report."""
+    user_content = TEAM_REPORT_USER_TEMPLATE.format(
+        run_id=inputs.run_id,
+        charts=inputs.charts,
+        insights_json=inputs.insights_json,
+        dept=dept
+    )
+    return [
+        {"role": "system", "content": TEAM_REPORT_SYSTEM_PROMPT},
+        {"role": "user", "content": user_content},
+    ]
+
+
+def team_report_path(team_reports_dir: Path, dept: str) -> Path:
+    return team_reports_dir / f"{dept.lower().replace(' ', '_')}_team_report.md"
+
+
+def _failed_team_report(dept: str, exc: Any) -> tuple[str, Dict[str, int]]:
+    return f"# {dept} TEAM REPORT\n\nReport generation failed: {exc}", {"total_tokens": 0}
+
+
+def is_complete_team_report(report: str) -> bool:
+    return all(section in report for section in TEAM_REPORT_SECTIONS)
+
+
+def estimate_prompt_tokens(messages: List[Dict[str, str]]) -> int:
+    return sum(len(message["content"]) for message in messages) // PROMPT_CHARS_PER_TOKEN
+
+
+def _add_token_usage(total: Dict[str, int], extra: Dict[str, int]) -> Dict[str, int]:
+    return {key: total.get(key, 0) + extra.get(key, 0) for key in total.keys() | extra.keys()}
+
+
+def _generate_team_report(
     client: OpenAI,
-    run_id: str,
-    pipeline_summary: Dict[str, Any],
-    data_insights: Dict[str, Any],
-    chart_files: List[str] = None,
-    model_name: str = "gpt-4.1"
-) -> Dict[str, tuple[str, Dict[str, int]]]:
-    """Generate department-specific team reports based on data insights."""
+    dept: str,
+    inputs: ReportInputs,
+    model_name: str,
+    output_dir: Optional[Path],
+    fallback_model_name: str = TEAM_REPORT_FALLBACK_MODEL
+) -> tuple[str, Dict[str, int]]:
+    """Generate a single department report; failures become an inline error report.
+
+    The report is first requested from ``model_name``; if it lacks one of the
+    required sections it is regenerated with ``fallback_model_name`` and a larger
+    output cap. Prompts estimated too long for the small model go to the
+    fallback model directly.
+    """
+    messages = build_team_report_messages(dept, inputs)
     
-    # Identify relevant departments based on data
+    def call(model: str) -> tuple[str, Dict[str, int]]:
+        return call_chat_completion(
+            client,
+            f"{dept} report ({model})",
+            model_name=model,
+            messages=messages,
+            temperature=TEAM_REPORT_TEMPERATURE,
+            max_tokens=TEAM_REPORT_FALLBACK_MAX_TOKENS if model == fallback_model_name else TEAM_REPORT_MAX_TOKENS,
+            output_path=team_report_path(output_dir, dept) if output_dir else None
+        )
+    
+    try:
+        if model_name == fallback_model_name or estimate_prompt_tokens(messages) > TEAM_REPORT_SMALL_MODEL_MAX_PROMPT_TOKENS:
+            return call(fallback_model_name)
+        report, token_usage = call(model_name)
+        if is_complete_team_report(report):
+            return report, token_usage
+        logger.warning(f"{dept} report from {model_name} is missing required sections; retrying with {fallback_model_name}")
+        report, fallback_usage = call(fallback_model_name)
+        return report, _add_token_usage(token_usage, fallback_usage)
+    except Exception as exc:
+        logger.warning(f"Failed to generate {dept} report: {exc}")
+        return _failed_team_report(dept, exc)
+
+
+def select_departments(data_insights: Dict[str, Any]) -> List[str]:
+    """Identify relevant departments based on data."""
     departments = []
     if data_insights.get("total_customers", 0) > 0:
         departments.extend(["Marketing", "Sales", "Customer Service"])
@@ -380,204 +848,227 @@ def generate_team_reports(
         departments.append("Finance")
     if data_insights.get("operational_metrics"):
         departments.append("IT Operations")
+    return departments
+
+
+def generate_team_reports(
+    client: OpenAI,
+    inputs: ReportInputs,
+    model_name: str = TEAM_REPORT_MODEL,
+    max_workers: int = MAX_CONCURRENT_LLM_CALLS,
+    output_dir: Optional[Path] = None
+) -> Dict[str, tuple[str, Dict[str, int]]]:
+    """Generate department-specific team reports based on data insights.
+
+    Departments are independent, so their LLM calls run concurrently on a
+    thread pool (bounded by ``max_workers``); results keep department order.
+    With ``output_dir`` each report is streamed into its markdown file there.
+    """
     
-    team_reports = {}
+    departments = select_departments(inputs.data_insights)
+    if not departments:
+        return {}
     
-    for dept in departments:
-        system_msg = {
-            "role": "system",
-            "content": (
-                f"You are a Senior Analytics Architect creating a {dept} team report. "
-                "Focus on implementation, operations, and actionable next steps. "
-                "Use technical terms appropriately for this audience. Be evidence-first and concrete."
-            )
-        }
-        
-        user_msg = {
-            "role": "user",
-            "content": (
-                f"Create a {dept} Team Implementation Report from this data analysis.\n\n"
-                f"Pipeline Run ID: {run_id}\n"
-                f"Charts available: {', '.join(chart_files) if chart_files else 'None'}\n\n"
-                "Data Insights:\n"
-                f"{json.dumps(data_insights, indent=2)}\n\n"
-                "Create report with these sections (300-500 words):\n\n"
-                f"# {dept.upper()} TEAM REPORT\n\n"
-                "## Scope & Objectives\n"
-                f"- What {dept} can now do with this data\n"
-                "- Specific capabilities enabled\n\n"
-                "## Key Insights for Your Department\n"
-                f"- Data points most relevant to {dept}\n"
-                "- Actionable insights with evidence\n\n"
-                "## Implementation Actions\n"
-                "- Specific steps your team should take\n"
-                "- Priority order and timelines\n\n"
-                "## Success Metrics\n"
-                f"- How {dept} should measure success\n"
-                "- KPIs to track\n\n"
-                "## Risks & Dependencies\n"
-                f"- What could impact {dept}'s success\n"
-                "- Dependencies on other teams\n\n"
-                f"Focus on what {dept} teams need to know and do. Use appropriate technical depth."
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(departments))) as executor:
+        futures = {
+            dept: executor.submit(
+                _generate_team_report, client, dept, inputs, model_name, output_dir
             )
+            for dept in departments
         }
-        
-        try:
-            start_time = time.time()
-            response = client.chat.completions.create(
-                model=model_name,
-                messages=[system_msg, user_msg],
-                temperature=0.3,
-                max_tokens=1500
-            )
-            duration = time.time() - start_time
-            
-            token_usage = {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
-            if hasattr(response, 'usage') and response.usage:
-                token_usage = {
-                    "prompt_tokens": response.usage.prompt_tokens,
-                    "completion_tokens": response.usage.completion_tokens,
-                    "total_tokens": response.usage.total_tokens,
-                }
-            
-            logger.info(f"{dept} report LLM call completed in {duration:.2f}s, tokens: {token_usage}")
-            
-            content = response.choices[0].message.content or ""
-            team_reports[dept] = (content.strip(), token_usage)
-            
-        except Exception as exc:
-            logger.warning(f"Failed to generate {dept} report: {exc}")
-            team_reports[dept] = (f"# {dept} TEAM REPORT\n\nReport generation failed: {exc}", {"total_tokens": 0})
-    
-    return team_reports
+        return {dept: future.result() for dept, future in futures.items()}
+
+
+def build_business_report_messages(inputs: ReportInputs) -> List[Dict[str, str]]:
+    """Build the chat messages for the enterprise-template business report."""
+    user_content = BUSINESS_REPORT_USER_TEMPLATE.format(
+        charts=inputs.charts,
+        summary_json=inputs.summary_json,
+        insights_json=inputs.insights_json
+    )
+    return [
+        {"role": "system", "content": BUSINESS_REPORT_SYSTEM_PROMPT},
+        {"role": "user", "content": user_content},
+    ]
 
 
 def generate_business_report(
     client: OpenAI,
-    run_id: str,
-    pipeline_summary: Dict[str, Any],
-    data_insights: Dict[str, Any],
-    chart_files: List[str] = None,
+    inputs: ReportInputs,
     model_name: str = "gpt-4.1"
 ) -> tuple[str, Dict[str, int]]:
     """Generate C-Level business insights report following enterprise template."""
     
-    system_msg = {
-        "role": "system",
-        "content": (
-            "You are a senior management consultant creating C-Level business reports. "
-            "Your audience is executives, board members, and business stakeholders who need "
-            "decision-ready insights with clear ROI and actionable recommendations. "
-            "Focus on business impact, not technical details. Use professional, executive language."
-        )
-    }
-    
-    user_msg = {
-        "role": "user", 
-        "content": (
-            "Create a C-Level business report from this data pipeline execution. "
-            "Follow the enterprise template structure exactly.\n\n"
-            f"Charts available: {', '.join(chart_files) if chart_files else 'None'}\n\n"
-            "Technical Pipeline Summary:\n"
-            "----------------------------\n"
-            f"{json.dumps(pipeline_summary, indent=2)}\n\n"
-            "Business Data Insights:\n"
-            "----------------------\n"
-            f"{json.dumps(data_insights, indent=2)}\n\n"
-            "Create a professional C-Level report with these sections:\n\n"
-            "# 1. MANAGEMENT SNAPSHOT\n"
-            "- Report title: 'Data Analytics Pipeline - Business Impact Assessment'\n"
-            "- Data as of: [current date]\n"
-            "- Target audience: C-Level Executives, Business Stakeholders\n"
-            "- **1-sentence thesis** (core business value)\n"
-            "- **Top 3 findings** (with numbers)\n"
-            "- **Top 3 recommendations** (actionable)\n"
-            "- **Expected business impact** (quantified)\n"
-            "- **Data confidence level** (High/Medium/Low)\n\n"
-            "# 2. EXECUTIVE SUMMARY\n"
-            "- **Why now?** Business context and opportunity\n"
-            "- **What was analyzed?** Data scope and systems\n"
-            "- **Key insights** (3-5 bullets with metrics)\n"
-            "- **So what?** Impact on revenue, costs, customer satisfaction\n"
-            "- **Now what?** Priority recommendations\n"
-            "- **Resource requirements** (budget, timeline, dependencies)\n\n"
-            "# 3. BUSINESS CONTEXT & OBJECTIVES\n"
-            "- Current market situation and internal triggers\n"
-            "- Business goals enabled by data analytics\n"
-            "- Key business questions answered\n"
-            "- Success criteria and KPIs\n\n"
-            "# 4. DATA SCOPE & ASSUMPTIONS\n"
-            "- Data sources: CRM, ERP systems\n"
-            "- Coverage: customers, products, transactions, locations\n"
-            "- Time period and data quality\n"
-            "- Key assumptions and limitations\n\n"
-            "# 5. KEY FINDINGS (Decision-Oriented)\n"
-            "For each finding provide:\n"
-            "- **Insight** (1 sentence)\n"
-            "- **Evidence** (specific numbers)\n"
-            "- **Business impact** (revenue, cost, risk)\n"
-            "- **Root cause** (why this matters)\n"
-            "- **Action opportunity** (what can be done)\n"
-            "- **Chart reference** (if applicable: executive_kpis_trend.png, data_quality_dashboard.png)\n\n"
-            "Focus on:\n"
-            "- Customer segmentation and value\n"
-            "- Product performance and optimization\n"
-            "- Revenue trends and drivers\n"
-            "- Operational efficiency gains\n\n"
-            "# 6. FINANCIAL IMPACT & VALUE CASE\n"
-            "- Baseline vs. target state\n"
-            "- Value potential (conservative/expected/optimistic)\n"
-            "- ROI from data-driven decisions\n"
-            "- Cost savings from automation\n\n"
-            "# 7. STRATEGIC RECOMMENDATIONS\n"
-            "For each recommendation:\n"
-            "- **Initiative title**\n"
-            "- **Business outcome** (KPI target)\n"
-            "- **Specific actions** (3-5 steps)\n"
-            "- **Owner** (business function)\n"
-            "- **Effort level** (S/M/L)\n"
-            "- **Expected impact** (quantified)\n"
-            "- **Timeline** (Quick win vs. long-term)\n\n"
-            "# 8. IMPLEMENTATION ROADMAP\n"
-            "- 30-60-90 day plan\n"
-            "- Quick wins vs. strategic initiatives\n"
-            "- Key milestones and deliverables\n"
-            "- Success metrics and tracking\n\n"
-            "# 9. RISKS & GOVERNANCE\n"
-            "- Top business risks\n"
-            "- Data governance and compliance\n"
-            "- Quality controls and monitoring\n"
-            "- Ownership and accountability\n\n"
-            "Use specific numbers from the data. Focus on business outcomes, not technical processes. "
-            "Make every section actionable for executives."
-        )
-    }
-    
-    start_time = time.time()
-    response = client.chat.completions.create(
-        model=model_name,
-        messages=[system_msg, user_msg],
+    return call_chat_completion(
+        client,
+        "Business report",
+        model_name=model_name,
+        messages=build_business_report_messages(inputs),
         temperature=0.3,
         max_tokens=3000
     )
-    duration = time.time() - start_time
+
+def _usage_from_payload(usage: Optional[Dict[str, Any]]) -> Dict[str, int]:
+    usage = usage or {}
+    return {
+        "prompt_tokens": usage.get("prompt_tokens", 0),
+        "completion_tokens": usage.get("completion_tokens", 0),
+        "total_tokens": usage.get("total_tokens", 0),
+        "cached_tokens": (usage.get("prompt_tokens_details") or {}).get("cached_tokens") or 0,
+    }
+
+
+def _generate_reports_concurrently(
+    client: OpenAI,
+    inputs: ReportInputs,
+    reports_dir: Path,
+    team_model_name: str = TEAM_REPORT_MODEL
+) -> tuple[str, Dict[str, int], Dict[str, tuple[str, Dict[str, int]]]]:
+    # Generate C-Level report in the background while the team reports run;
+    # both stream into their final report files as tokens arrive
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        c_level_future = executor.submit(
+            generate_c_level_report,
+            client=client,
+            inputs=inputs,
+            output_path=reports_dir / "c_level_executive_report.md"
+        )
+        
+        # Generate department-specific team reports
+        team_reports = generate_team_reports(
+            client=client,
+            inputs=inputs,
+            model_name=team_model_name,
+            output_dir=reports_dir / "team_reports"
+        )
+        c_level_report, c_level_tokens = c_level_future.result()
+    return c_level_report, c_level_tokens, team_reports
+
+
+def run_batch_chat_completions(
+    client: OpenAI,
+    requests: Dict[str, Dict[str, Any]],
+    poll_interval_s: float = BATCH_POLL_INTERVAL_S
+) -> Dict[str, tuple[str, Dict[str, int]]]:
+    """Submit chat-completion bodies as one OpenAI Batch API job and wait for the results.
+
+    ``requests`` maps a ``custom_id`` to a chat-completion request body. The
+    returned dict maps each successfully answered ``custom_id`` to
+    ``(content, token_usage)``; failed or missing entries are omitted.
+    """
+    lines = [
+        json.dumps({"custom_id": custom_id, "method": "POST", "url": "/v1/chat/completions", "body": body})
+        for custom_id, body in requests.items()
+    ]
+    batch_input = client.files.create(
+        file=("business_insights_batch.jsonl", "\n".join(lines).encode("utf-8")),
+        purpose="batch"
+    )
+    batch = client.batches.create(
+        input_file_id=batch_input.id,
+        endpoint="/v1/chat/completions",
+        completion_window=BATCH_COMPLETION_WINDOW
+    )
+    logger.info(f"Submitted batch {batch.id} with {len(lines)} requests")
     
-    # Track token usage
-    token_usage = {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
-    if hasattr(response, 'usage') and response.usage:
-        token_usage = {
-            "prompt_tokens": response.usage.prompt_tokens,
-            "completion_tokens": response.usage.completion_tokens,
-            "total_tokens": response.usage.total_tokens,
-        }
+    while batch.status not in BATCH_TERMINAL_STATUSES:
+        time.sleep(poll_interval_s)
+        batch = client.batches.retrieve(batch.id)
+    if batch.status != "completed" or not batch.output_file_id:
+        raise RuntimeError(f"Batch {batch.id} finished with status '{batch.status}'")
     
-    logger.info(f"Business report LLM call completed in {duration:.2f}s, tokens: {token_usage}")
+    results = {}
+    for line in client.files.content(batch.output_file_id).text.splitlines():
+        if not line.strip():
+            continue
+        record = json.loads(line)
+        response = record.get("response") or {}
+        if record.get("error") or response.get("status_code") != 200:
+            logger.warning(f"Batch request {record.get('custom_id')} failed: {record.get('error') or response}")
+            continue
+        body = response.get("body") or {}
+        content = body["choices"][0]["message"].get("content") or ""
+        results[record["custom_id"]] = (content.strip(), _usage_from_payload(body.get("usage")))
+    logger.info(f"Batch {batch.id} completed: {len(results)}/{len(lines)} requests succeeded")
+    return results
+
+
+def generate_reports_via_batch(
+    client: OpenAI,
+    inputs: ReportInputs,
+    model_name: str = "gpt-4.1",
+    team_model_name: str = TEAM_REPORT_MODEL
+) -> tuple[tuple[str, Dict[str, int]], Dict[str, tuple[str, Dict[str, int]]]]:
+    """Generate the C-Level and all team reports through a single Batch API job.
+
+    Team reports that come back without the required sections are regenerated
+    synchronously with the fallback model.
+    """
+    departments = select_departments(inputs.data_insights)
+    requests = {
+        "c_level": {
+            "model": model_name,
+            "messages": build_c_level_messages(inputs),
+            "temperature": C_LEVEL_TEMPERATURE,
+            "max_tokens": C_LEVEL_MAX_TOKENS,
+        }
+    }
+    for dept in departments:
+        requests[f"team:{dept}"] = {
+            "model": team_model_name,
+            "messages": build_team_report_messages(dept, inputs),
+            "temperature": TEAM_REPORT_TEMPERATURE,
+            "max_tokens": TEAM_REPORT_MAX_TOKENS,
+        }
     
-    content = response.choices[0].message.content or ""
-    return content.strip(), token_usage
+    results = run_batch_chat_completions(client, requests)
+    if "c_level" not in results:
+        raise RuntimeError("Batch output contains no C-Level report")
+    team_reports = {
+        dept: results.get(f"team:{dept}") or _failed_team_report(dept, "missing from batch output")
+        for dept in departments
+    }
+    for dept, (report, token_usage) in team_reports.items():
+        if f"team:{dept}" in results and not is_complete_team_report(report):
+            logger.warning(f"{dept} batch report is missing required sections; regenerating with {TEAM_REPORT_FALLBACK_MODEL}")
+            try:
+                fallback_report, fallback_usage = call_chat_completion(
+                    client,
+                    f"{dept} report ({TEAM_REPORT_FALLBACK_MODEL})",
+                    model_name=TEAM_REPORT_FALLBACK_MODEL,
+                    messages=build_team_report_messages(dept, inputs),
+                    temperature=TEAM_REPORT_TEMPERATURE,
+                    max_tokens=TEAM_REPORT_FALLBACK_MAX_TOKENS
+                )
+            except Exception as exc:
+                logger.warning(f"Fallback {dept} report failed, keeping batch output: {exc}")
+                continue
+            team_reports[dept] = (fallback_report, _add_token_usage(token_usage, fallback_usage))
+    return results["c_level"], team_reports
+
+
+def write_report_files(files: Dict[Path, str], max_workers: int = MAX_CONCURRENT_LLM_CALLS) -> None:
+    """Write report files concurrently; each text is encoded once and written as bytes."""
+    if not files:
+        return
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(files))) as executor:
+        futures = [executor.submit(path.write_bytes, content.encode("utf-8")) for path, content in files.items()]
+        for future in futures:
+            future.result()
+
 
-def create_business_insights_report(run_id: str) -> None:
-    """Main function to create business insights report."""
+def create_business_insights_report(
+    run_id: str,
+    use_batch_api: bool = False,
+    team_model_name: str = TEAM_REPORT_MODEL
+) -> None:
+    """Main function to create business insights report.
+
+    With ``use_batch_api`` the LLM reports are submitted as one OpenAI Batch
+    API job (half price, but results may take up to the completion window)
+    instead of concurrent synchronous calls. Team reports use
+    ``team_model_name``; the C-Level report stays on gpt-4.1.
+    """
     logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
     logger.info(f"Starting business insights report generation for run_id={run_id}")
     
@@ -592,32 +1083,32 @@ def create_business_insights_report(run_id: str) -> None:
         summary_path = reports_dir / "summary_report.json"
         pipeline_summary = read_json(summary_path)
         
-        # Analyze Gold layer data
+        # Analyze Gold layer data (cached per Gold input state); charts render
+        # in the background while the LLM calls are in flight
         gold_data_dir = repo_root / "artifacts" / "gold" / "marts" / run_id / "data"
-        data_insights = analyze_data_samples(gold_data_dir)
-        
-        # Create business charts
         charts_dir = reports_dir / "charts"
-        chart_files = create_business_charts(gold_data_dir, charts_dir)
-        
-        # Generate C-Level report
-        client = build_llm_client()
-        c_level_report, c_level_tokens = generate_c_level_report(
-            client=client,
-            run_id=run_id,
-            pipeline_summary=pipeline_summary,
-            data_insights=data_insights,
-            chart_files=chart_files
-        )
-        
-        # Generate department-specific team reports
-        team_reports = generate_team_reports(
-            client=client,
-            run_id=run_id,
-            pipeline_summary=pipeline_summary,
-            data_insights=data_insights,
-            chart_files=chart_files
-        )
+        with ThreadPoolExecutor(max_workers=1) as chart_executor:
+            data_insights, charts_future = start_insights_build(
+                gold_data_dir, charts_dir, repo_root / INSIGHTS_CACHE_DIR, chart_executor
+            )
+            if charts_future.done():
+                chart_files = charts_future.result()
+            else:
+                chart_files = expected_chart_files(gold_data_dir)
+            
+            # Serialize the prompt payloads once for all report calls
+            inputs = ReportInputs(run_id, pipeline_summary, data_insights, chart_files)
+            client = build_llm_client()
+            if use_batch_api:
+                (c_level_report, c_level_tokens), team_reports = generate_reports_via_batch(client, inputs, team_model_name=team_model_name)
+            else:
+                c_level_report, c_level_tokens, team_reports = _generate_reports_concurrently(
+                    client, inputs, reports_dir, team_model_name=team_model_name
+                )
+            
+            rendered_charts = charts_future.result()
+            if rendered_charts != chart_files:
+                logger.warning(f"Rendered charts {rendered_charts} differ from those referenced in reports {chart_files}")
         
         # Calculate total token usage
         total_tokens = c_level_tokens.copy()
@@ -625,21 +1116,16 @@ def create_business_insights_report(run_id: str) -> None:
             for key in total_tokens:
                 total_tokens[key] += tokens.get(key, 0)
         
-        # Save C-Level business report
+        # Collect report files (final text replaces the streamed drafts); written together below
         reports_dir.mkdir(parents=True, exist_ok=True)
-        
-        c_level_report_path = reports_dir / "c_level_executive_report.md"
-        c_level_report_path.write_text(c_level_report, encoding="utf-8")
-        logger.info(f"C-Level executive report saved to: {c_level_report_path}")
-        
-        # Save department team reports
         team_reports_dir = reports_dir / "team_reports"
         team_reports_dir.mkdir(exist_ok=True)
         
+        c_level_report_path = reports_dir / "c_level_executive_report.md"
+        report_files = {c_level_report_path: c_level_report}
         for dept, (report_content, dept_tokens) in team_reports.items():
-            dept_file = team_reports_dir / f"{dept.lower().replace(' ', '_')}_team_report.md"
-            dept_file.write_text(report_content, encoding="utf-8")
-            logger.info(f"{dept} team report saved to: {dept_file}")
+            report_files[team_report_path(team_reports_dir, dept)] = report_content
+        
         executive_summary = {
             "run_id": run_id,
             "generated_at": datetime.now(timezone.utc).isoformat(),
@@ -682,12 +1168,11 @@ def create_business_insights_report(run_id: str) -> None:
         }
         
         executive_summary_path = reports_dir / "executive_summary.json"
-        executive_summary_path.write_text(
-            json.dumps(executive_summary, indent=2, ensure_ascii=False),
-            encoding="utf-8"
-        )
+        report_files[executive_summary_path] = json.dumps(executive_summary, indent=2, ensure_ascii=False)
+        write_report_files(report_files)
         
         logger.info(f"C-Level executive report saved to: {c_level_report_path}")
+        logger.info(f"Team reports saved to: {team_reports_dir}")
         logger.info(f"Generated {len(team_reports)} team reports")
         logger.info(f"Total token usage: {total_tokens}")
         
@@ -728,4 +1213,5 @@ if __name__ == "__main__":
         sys.exit(1)
     
     run_id = sys.argv[1]
-    create_business_insights_report(run_id)
\ No newline at end of file
+    use_batch_api = os.getenv("BUSINESS_INSIGHTS_USE_BATCH_API", "").strip().lower() in {"1", "true", "yes"}
+    create_business_insights_report(run_id, use_batch_api=use_batch_api)
\ No newline at end of file
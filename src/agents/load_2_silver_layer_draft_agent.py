@@ -24,16 +24,28 @@ from __future__ import annotations
 import json
 import logging
 import os
+import random
+import re
 import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime, timezone
+from functools import partial
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 import yaml
 from dotenv import load_dotenv
 from openai import OpenAI
 
+try:
+    from yaml import CSafeDumper as YamlSafeDumper, CSafeLoader as YamlSafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as YamlSafeDumper, SafeLoader as YamlSafeLoader
+
 logger = logging.getLogger(__name__)
 
 # --------------------------------------------------------------------
@@ -202,10 +214,31 @@ D. Segmentation & Clustering for ML
        - One-time buyers.
 """
 
+# Built once and kept free of run-specific text so every request starts with
+# the same ~1.3k-token prefix, which OpenAI's automatic prompt caching reuses.
+HUMAN_REPORT_SYSTEM_PROMPT = (
+    "You are a senior Data & Analytics expert. "
+    "You produce concise but complete reports for humans. "
+    "Use the following Data Analytics process and catalogues as your guiding framework:\n\n"
+    + PROCESS_DESCRIPTION[:5000]  # Truncate long system prompt
+)
+
 
 # --------------------------------------------------------------------
 # OpenAI client & helpers
 # --------------------------------------------------------------------
+# Opt-in OpenAI Batch API path for the human report (half price, results
+# within the completion window); the run waits for the batch to finish.
+BATCH_API_ENV_VAR = "SILVER_REPORT_USE_BATCH_API"
+BATCH_COMPLETION_WINDOW = "24h"
+BATCH_POLL_INTERVAL_S = 30.0
+BATCH_TERMINAL_STATUSES = {"completed", "failed", "expired", "cancelled"}
+
+# Synchronous retries back off exponentially plus up to 1s of jitter, so
+# concurrent Silver runs hitting the same outage do not retry in lockstep.
+LLM_RETRY_MAX_DELAY_S = 8.0
+
+
 def _build_openai_client() -> OpenAI:
     load_dotenv()
 
@@ -232,6 +265,75 @@ def _build_openai_client() -> OpenAI:
     return client
 
 
+def _batch_api_enabled() -> bool:
+    return os.getenv(BATCH_API_ENV_VAR, "").strip().lower() in {"1", "true", "yes"}
+
+
+def _run_batch_chat_completion(
+    client: OpenAI,
+    custom_id: str,
+    body: Dict[str, Any],
+    poll_interval_s: float = BATCH_POLL_INTERVAL_S,
+) -> Tuple[str, Dict[str, int]]:
+    """Submit one chat-completion body as an OpenAI Batch API job and wait for its answer."""
+    line = json.dumps({"custom_id": custom_id, "method": "POST", "url": "/v1/chat/completions", "body": body})
+    batch_input = client.files.create(
+        file=("silver_draft_batch.jsonl", line.encode("utf-8")),
+        purpose="batch",
+    )
+    batch = client.batches.create(
+        input_file_id=batch_input.id,
+        endpoint="/v1/chat/completions",
+        completion_window=BATCH_COMPLETION_WINDOW,
+    )
+    logger.info("Submitted batch %s for %s.", batch.id, custom_id)
+
+    while batch.status not in BATCH_TERMINAL_STATUSES:
+        time.sleep(poll_interval_s)
+        batch = client.batches.retrieve(batch.id)
+    if batch.status != "completed" or not batch.output_file_id:
+        raise RuntimeError(f"Batch {batch.id} finished with status '{batch.status}'")
+
+    for output_line in client.files.content(batch.output_file_id).text.splitlines():
+        if not output_line.strip():
+            continue
+        record = json.loads(output_line)
+        response = record.get("response") or {}
+        if record.get("custom_id") != custom_id:
+            continue
+        if record.get("error") or response.get("status_code") != 200:
+            raise RuntimeError(f"Batch request {custom_id} failed: {record.get('error') or response}")
+        response_body = response.get("body") or {}
+        usage = response_body.get("usage") or {}
+        token_usage = {
+            "prompt_tokens": usage.get("prompt_tokens", 0),
+            "completion_tokens": usage.get("completion_tokens", 0),
+            "total_tokens": usage.get("total_tokens", 0),
+            "cached_tokens": (usage.get("prompt_tokens_details") or {}).get("cached_tokens") or 0,
+        }
+        return response_body["choices"][0]["message"].get("content") or "", token_usage
+    raise RuntimeError(f"Batch {batch.id} returned no output for {custom_id}")
+
+
+def _stream_completion_to_file(client: OpenAI, output_path: Path, **request: Any) -> Tuple[str, Any]:
+    """Stream a chat completion into ``output_path`` as tokens arrive; returns (content, usage)."""
+    stream = client.chat.completions.create(**request, stream=True, stream_options={"include_usage": True})
+    parts: List[str] = []
+    usage = None
+    # Truncate on each attempt so a retry never appends to a partial answer
+    with output_path.open("w", encoding="utf-8") as f:
+        for chunk in stream:
+            if chunk.choices:
+                delta = chunk.choices[0].delta.content or ""
+                if delta:
+                    f.write(delta)
+                    f.flush()
+                    parts.append(delta)
+            if getattr(chunk, "usage", None):
+                usage = chunk.usage
+    return "".join(parts), usage
+
+
 def _read_text(path: Path) -> str:
     if not path.exists():
         logger.warning("Text file not found: %s", path)
@@ -243,13 +345,16 @@ def _read_text(path: Path) -> str:
         raise RuntimeError(f"Failed to read text file: {path}") from exc
 
 
-def _read_yaml(path: Path) -> Dict[str, Any]:
-    if not path.exists():
+def _read_yaml(path: Path, text: Optional[str] = None) -> Dict[str, Any]:
+    """Parse a YAML file; ``text`` is its already-read content, which skips a second read."""
+    if text is None and not path.exists():
         logger.warning("YAML file not found: %s", path)
         return {}
     try:
+        if text is not None:
+            return yaml.load(text, Loader=YamlSafeLoader) or {}
         with path.open("r", encoding="utf-8") as f:
-            return yaml.safe_load(f) or {}
+            return yaml.load(f, Loader=YamlSafeLoader) or {}
     except Exception as exc:
         logger.exception("Failed to read YAML file: %s", path)
         raise RuntimeError(f"Failed to read YAML file: {path}") from exc
@@ -258,13 +363,14 @@ def _read_yaml(path: Path) -> Dict[str, Any]:
 # --------------------------------------------------------------------
 # Profiling helpers
 # --------------------------------------------------------------------
-def _detect_datetime_format(values: pd.Series) -> Optional[str]:
-    sample = values.dropna().astype(str).str.strip()
-    if sample.empty:
-        return None
-    sample = sample.head(20)
-
-    format_patterns = [
+# Type inference looks at a bounded head slice so per-column cost does not
+# grow with the row count; conversions then run on a small random sample.
+INFER_MAX_ROWS = 1_000_000
+INFER_SAMPLE_SIZE = 1000
+# Explicit formats tried by _detect_datetime_format, compiled once at import
+DATETIME_FORMAT_PATTERNS = [
+    (fmt, re.compile(pattern))
+    for fmt, pattern in [
         ("%Y-%m-%d %H:%M:%S", r"^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}$"),
         ("%Y-%m-%d %H:%M", r"^\d{4}-\d{2}-\d{2} \d{2}:\d{2}$"),
         ("%Y-%m-%d", r"^\d{4}-\d{2}-\d{2}$"),
@@ -272,48 +378,96 @@ def _detect_datetime_format(values: pd.Series) -> Optional[str]:
         ("%m/%d/%Y", r"^\d{1,2}/\d{1,2}/\d{4}$"),
         ("%Y/%m/%d", r"^\d{4}/\d{2}/\d{2}$"),
     ]
+]
+
+# Cheap probe for values pd.to_datetime could parse without an explicit format
+# (digit dates, clock times, month names); the dateutil fallback is skipped
+# for samples where fewer than 90% of the values look date-like.
+DATE_LIKE_RE = re.compile(
+    r"\d{1,4}[-/.]\d{1,2}|\d{1,2}:\d{2}|\b(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\b",
+    re.IGNORECASE,
+)
+
+# Bronze CSVs are profiled in worker processes once the run is large enough
+# to pay for the pool start-up (a fresh pandas import per worker on spawn).
+PROFILE_MAX_WORKERS = min(os.cpu_count() or 1, 8)
+PROFILE_PARALLEL_MIN_BYTES = 64 * 1024 * 1024
+# Bronze CSVs are read with low_memory=False: pandas then types each column
+# once over the whole file instead of per internal chunk, which can leave
+# mixed int/str object columns that miss the Arrow fast paths.
+# CSVs at least this large are parsed in blocks of columns to bound memory;
+# each pass reads about PROFILE_COLUMN_BLOCK_BYTES worth of the file's columns.
+PROFILE_COLUMNWISE_MIN_BYTES = 512 * 1024 * 1024
+PROFILE_COLUMN_BLOCK_BYTES = 256 * 1024 * 1024
+
+# Per-file profiles of a Bronze run are cached next to its data; bump the
+# version whenever the profile format or its heuristics change.
+PROFILE_CACHE_NAME = ".profile_cache.json"
+PROFILE_CACHE_VERSION = 1
+
+# (inferred type, null count, suggested transforms, key-candidate entry)
+_ColumnProfile = Tuple[str, int, List[str], Optional[Dict[str, Any]]]
+
+
+def _detect_datetime_format(values: pd.Series) -> Optional[str]:
+    sample = [str(value).strip() for value in values.dropna().head(20)]
+    if not sample:
+        return None
 
-    for fmt, pattern in format_patterns:
-        if sample.str.match(pattern).all():
+    for fmt, pattern in DATETIME_FORMAT_PATTERNS:
+        if all(pattern.match(value) for value in sample):
             return fmt
 
     return None
 
 
+def _strip_non_empty(values: pd.Series) -> pd.Series:
+    """Whitespace-stripped values without empty strings, trimmed by Arrow's C++ kernel when possible."""
+    try:
+        arr = pc.utf8_trim_whitespace(pa.Array.from_pandas(values))
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+        # Mixed-type object columns are stringified by pandas instead
+        stripped = values.astype(str).str.strip()
+        return stripped[stripped != ""]
+    return arr.filter(pc.not_equal(arr, "")).to_pandas()
+
+
 def _infer_series_type(series: pd.Series) -> str:
-    cleaned = series.dropna()
+    cleaned = series.iloc[:INFER_MAX_ROWS].dropna()
     if cleaned.empty:
         return "unknown"
 
     if cleaned.dtype == object:
-        cleaned = cleaned.astype(str).str.strip()
-        cleaned = cleaned[cleaned != ""]
+        cleaned = _strip_non_empty(cleaned)
         if cleaned.empty:
             return "unknown"
 
     # Performance optimization: sample large series
-    if len(cleaned) > 1000:
-        cleaned = cleaned.sample(n=1000, random_state=42)
+    if len(cleaned) > INFER_SAMPLE_SIZE:
+        cleaned = cleaned.sample(n=INFER_SAMPLE_SIZE, random_state=42)
 
     numeric = pd.to_numeric(cleaned, errors="coerce")
     numeric_ratio = float(numeric.notna().mean())
+    if numeric_ratio >= 0.9:
+        # Integer (and bool) dtypes are integral by construction; only floats need the modulo test
+        if numeric.dtype.kind in "iub" or (numeric.dropna() % 1 == 0).all():
+            return "integer"
+        return "float"
 
     detected_format = _detect_datetime_format(cleaned)
     if detected_format:
         # Use detected format for better performance
         datetime_values = pd.to_datetime(cleaned, errors="coerce", format=detected_format)
-    else:
+        datetime_ratio = float(datetime_values.notna().mean())
+    elif cleaned.astype(str).str.contains(DATE_LIKE_RE).mean() >= 0.9:
         # Suppress warnings for performance
         import warnings
         with warnings.catch_warnings():
             warnings.simplefilter("ignore")
             datetime_values = pd.to_datetime(cleaned, errors="coerce")
-    datetime_ratio = float(datetime_values.notna().mean())
-
-    if numeric_ratio >= 0.9:
-        if (numeric.dropna() % 1 == 0).all():
-            return "integer"
-        return "float"
+        datetime_ratio = float(datetime_values.notna().mean())
+    else:
+        datetime_ratio = 0.0
 
     if datetime_ratio >= 0.9:
         return "datetime"
@@ -334,84 +488,265 @@ def _detect_trim_needed(series: pd.Series) -> bool:
     return (stripped != series.astype(str)).any()
 
 
-def _profile_table(df: pd.DataFrame, filename: str) -> Dict[str, Any]:
-    rows = len(df)
-    columns = list(df.columns)
-    inferred_types: Dict[str, str] = {}
-    null_counts: Dict[str, int] = {}
-    key_candidates: List[Dict[str, Any]] = []
+def _as_string_array(series: pd.Series) -> Optional[pa.Array]:
+    """Arrow string array of a text column, or None for mixed-type and all-null columns."""
+    try:
+        arr = pa.Array.from_pandas(series)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return None
+    if not (pa.types.is_string(arr.type) or pa.types.is_large_string(arr.type)):
+        return None
+    return arr
+
+
+def _string_column_stats(arr: pa.Array, count_distinct: bool = True) -> Tuple[int, bool, Optional[int]]:
+    """Empty-string count, trim-needed flag and distinct count of a string column.
+
+    Computed with Arrow compute kernels on one Arrow conversion instead of
+    several pandas passes. Covers both object and pandas' ``str`` dtype.
+    """
+    empty_count = pc.sum(pc.equal(arr, "")).as_py() or 0
+    trim_needed = bool(pc.any(pc.not_equal(pc.utf8_trim_whitespace(arr), arr)).as_py())
+    distinct_count = pc.count_distinct(arr).as_py() if count_distinct else None
+    return empty_count, trim_needed, distinct_count
+
+
+def _profile_column(col: str, series: pd.Series, rows: int) -> _ColumnProfile:
+    """Inferred type, null count, suggested transforms and key-candidate entry of one column."""
     suggested_transforms: List[str] = []
+    col_lower = col.lower()
+    is_key_like = "id" in col_lower or col_lower.endswith("_id") or col_lower.endswith("key")
+    is_text = pd.api.types.is_string_dtype(series.dtype)
+    arr = _as_string_array(series) if is_text else None
+    # Arrow keeps the null count as array metadata, so only empty strings need a scan
+    nulls = arr.null_count if arr is not None else int(series.isna().sum())
+    # The distinct count only feeds the key-candidate checks below
+    needs_uniqueness = rows > 0 and (nulls == 0 or is_key_like)
+    string_stats = _string_column_stats(arr, needs_uniqueness) if arr is not None else None
+    if string_stats:
+        nulls += string_stats[0]
+    elif is_text:
+        nulls += int((series == "").sum())
+
+    inferred = _infer_series_type(series)
+
+    dtype_name = str(series.dtype)
+    if inferred in {"integer", "float"} and dtype_name == "object":
+        suggested_transforms.append(f"Cast {col} to numeric ({inferred}).")
+    if inferred == "datetime" and dtype_name == "object":
+        suggested_transforms.append(f"Parse {col} as datetime.")
+    trim_needed = string_stats[1] if string_stats else _detect_trim_needed(series)
+    if trim_needed:
+        suggested_transforms.append(f"Trim whitespace in {col}.")
+    if nulls > 0:
+        suggested_transforms.append(f"Standardize missing values in {col}.")
+
+    key_candidate: Optional[Dict[str, Any]] = None
+    if not needs_uniqueness:
+        return inferred, nulls, suggested_transforms, key_candidate
+    unique_non_null = string_stats[2] if string_stats else int(series.nunique(dropna=True))
+    uniqueness_ratio = unique_non_null / rows
+    if nulls == 0 and unique_non_null == rows:
+        key_candidate = {"column": col, "reason": "unique_non_null"}
+    elif is_key_like and uniqueness_ratio >= 0.98:
+        key_candidate = {
+            "column": col,
+            "reason": f"high_uniqueness_{uniqueness_ratio:.2%}",
+        }
+    return inferred, nulls, suggested_transforms, key_candidate
+
 
-    duplicate_rows = int(df.duplicated().sum())
+def _assemble_table_profile(
+    filename: str,
+    rows: int,
+    column_profiles: Dict[str, _ColumnProfile],
+    duplicate_rows: int,
+) -> Dict[str, Any]:
+    suggested_transforms: List[str] = []
     if duplicate_rows > 0:
         suggested_transforms.append(
             f"Remove or consolidate {duplicate_rows} duplicate rows in {filename}."
         )
-
-    for col in columns:
-        series = df[col]
-        nulls = int(series.isna().sum())
-        if series.dtype == object:
-            nulls += int((series == "").sum())
-        null_counts[col] = nulls
-
-        inferred = _infer_series_type(series)
-        inferred_types[col] = inferred
-
-        dtype_name = str(series.dtype)
-        col_lower = col.lower()
-        if inferred in {"integer", "float"} and dtype_name == "object":
-            suggested_transforms.append(f"Cast {col} to numeric ({inferred}).")
-        if inferred == "datetime" and dtype_name == "object":
-            suggested_transforms.append(f"Parse {col} as datetime.")
-        if _detect_trim_needed(series):
-            suggested_transforms.append(f"Trim whitespace in {col}.")
-        if nulls > 0:
-            suggested_transforms.append(f"Standardize missing values in {col}.")
-
-        unique_non_null = int(series.nunique(dropna=True))
-        uniqueness_ratio = (unique_non_null / rows) if rows else 0.0
-        if nulls == 0 and unique_non_null == rows and rows > 0:
-            key_candidates.append(
-                {"column": col, "reason": "unique_non_null"}
-            )
-        elif ("id" in col_lower or col_lower.endswith("_id") or col_lower.endswith("key")) and uniqueness_ratio >= 0.98:
-            key_candidates.append(
-                {
-                    "column": col,
-                    "reason": f"high_uniqueness_{uniqueness_ratio:.2%}",
-                }
-            )
-
+    for _, _, column_transforms, _ in column_profiles.values():
+        suggested_transforms.extend(column_transforms)
     if not suggested_transforms:
         suggested_transforms.append("No obvious Silver transformations detected.")
 
     return {
         "table": filename,
         "row_count": rows,
-        "column_count": len(columns),
-        "columns": columns,
-        "inferred_types": inferred_types,
-        "null_counts": null_counts,
+        "column_count": len(column_profiles),
+        "columns": list(column_profiles),
+        "inferred_types": {col: profile[0] for col, profile in column_profiles.items()},
+        "null_counts": {col: profile[1] for col, profile in column_profiles.items()},
         "duplicate_rows": duplicate_rows,
-        "key_candidates": key_candidates,
+        "key_candidates": [profile[3] for profile in column_profiles.values() if profile[3]],
         "suggested_silver_transforms": sorted(set(suggested_transforms)),
     }
 
 
-def _profile_bronze_run(data_dir: Path) -> Dict[str, Any]:
-    tables: Dict[str, Any] = {}
+def _has_unique_column(column_profiles: Dict[str, _ColumnProfile]) -> bool:
+    # A unique non-null column makes every row distinct, so no duplicate scan is needed
+    return any(
+        profile[3] is not None and profile[3]["reason"] == "unique_non_null"
+        for profile in column_profiles.values()
+    )
+
+
+def _profile_table(df: pd.DataFrame, filename: str) -> Dict[str, Any]:
+    rows = len(df)
+    column_profiles = {col: _profile_column(col, df[col], rows) for col in df.columns}
+    duplicate_rows = 0 if _has_unique_column(column_profiles) else int(df.duplicated().sum())
+    return _assemble_table_profile(filename, rows, column_profiles, duplicate_rows)
+
+
+def _column_blocks(csv_path: Path, column_count: int) -> List[List[int]]:
+    """Column positions grouped so one pass parses about PROFILE_COLUMN_BLOCK_BYTES of the file."""
+    file_bytes = max(csv_path.stat().st_size, 1)
+    per_block = max(1, int(column_count * PROFILE_COLUMN_BLOCK_BYTES // file_bytes))
+    return [list(range(start, min(start + per_block, column_count))) for start in range(0, column_count, per_block)]
+
+
+def _column_hashes(series: pd.Series) -> np.ndarray:
+    return pd.util.hash_pandas_object(series, index=False).to_numpy()
+
+
+def _exact_duplicate_count(csv_path: Path, blocks: List[List[int]], candidates: np.ndarray) -> int:
+    """Duplicate rows among hash candidates, compared on their parsed values block by block.
+
+    Each pass refines a group id per candidate row with the block's values, so
+    only candidate ids (not candidate rows) are kept between passes.
+    """
+    group_ids = pd.Series(np.zeros(len(candidates), dtype=np.int64))
+    for block in blocks:
+        frame = pd.read_csv(csv_path, usecols=block, low_memory=False).iloc[candidates].reset_index(drop=True)
+        keys = pd.concat([group_ids, *(frame.iloc[:, i] for i in range(frame.shape[1]))], axis=1, ignore_index=True)
+        group_ids = keys.groupby(list(keys.columns), sort=False, dropna=False).ngroup()
+        del frame, keys
+    return len(candidates) - group_ids.nunique()
+
+
+def _profile_csv_by_column(csv_path: Path) -> Dict[str, Any]:
+    """Profile a large CSV while holding only one block of parsed columns in memory.
+
+    pandas parses each column exactly as in a full read, so the profile
+    matches ``_profile_table``. Rows are first compared by 64-bit hashes
+    combined column by column (8 bytes per row); rows sharing a hash are then
+    confirmed on their values in a second pass, so hash collisions cannot
+    change the duplicate count. Both steps stop once a unique non-null column
+    shows that every row is distinct.
+    """
+    columns = list(pd.read_csv(csv_path, nrows=0).columns)
+    blocks = _column_blocks(csv_path, len(columns))
+    rows = 0
+    row_hashes: Optional[np.ndarray] = None
+    rows_distinct = False
+    column_profiles: Dict[str, _ColumnProfile] = {}
+    for block in blocks:
+        frame = pd.read_csv(csv_path, usecols=block, low_memory=False)
+        rows = len(frame)
+        # Positions, not names: a block read re-mangles duplicate header names
+        for position, series in zip(block, (frame.iloc[:, i] for i in range(frame.shape[1]))):
+            col = columns[position]
+            column_profiles[col] = _profile_column(col, series, rows)
+            rows_distinct = rows_distinct or _has_unique_column({col: column_profiles[col]})
+            if rows_distinct:
+                row_hashes = None
+                continue
+            column_hashes = _column_hashes(series)
+            if row_hashes is None:
+                row_hashes = column_hashes
+            else:
+                # Order-sensitive combine so swapped values in two columns do not collide
+                row_hashes = row_hashes * np.uint64(1_000_003) ^ column_hashes
+        del frame
+    duplicate_rows = 0
+    if row_hashes is not None:
+        candidates = np.flatnonzero(pd.Series(row_hashes).duplicated(keep=False).to_numpy())
+        if candidates.size:
+            duplicate_rows = _exact_duplicate_count(csv_path, blocks, candidates)
+    return _assemble_table_profile(csv_path.name, rows, column_profiles, duplicate_rows)
+
+
+def _read_and_profile(path_str: str) -> Dict[str, Any]:
+    # Module-level so it can be pickled into ProcessPoolExecutor workers
+    csv_path = Path(path_str)
+    if csv_path.stat().st_size >= PROFILE_COLUMNWISE_MIN_BYTES:
+        return _profile_csv_by_column(csv_path)
+    df = pd.read_csv(csv_path, low_memory=False)
+    return _profile_table(df, csv_path.name)
+
+
+def _profile_cache_key(csv_path: Path) -> str:
+    stat = csv_path.stat()
+    return f"{csv_path.name}:{stat.st_mtime_ns}:{stat.st_size}"
+
+
+def _load_profile_cache(cache_path: Path) -> Dict[str, Any]:
+    try:
+        cache = json.loads(cache_path.read_bytes())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cache, dict) or cache.get("version") != PROFILE_CACHE_VERSION:
+        return {}
+    return cache.get("tables", {})
+
+
+def _write_profile_cache(cache_path: Path, entries: Dict[str, Any]) -> None:
+    payload = json.dumps({"version": PROFILE_CACHE_VERSION, "tables": entries}, ensure_ascii=False)
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        tmp_path.write_text(payload, encoding="utf-8")
+        os.replace(tmp_path, cache_path)
+    except OSError as exc:
+        logger.warning("Could not write Bronze profile cache %s: %s", cache_path, exc)
+        tmp_path.unlink(missing_ok=True)
+
+
+def _profile_bronze_run(data_dir: Path, cache_path: Optional[Path] = None) -> Dict[str, Any]:
+    """Profile every CSV in ``data_dir``.
+
+    With ``cache_path``, files whose name, mtime and size match a cached
+    entry are not read again; failed files are never cached.
+    """
+    csv_paths = sorted(data_dir.glob("*.csv"))
+    cache_keys = {path.name: _profile_cache_key(path) for path in csv_paths} if cache_path else {}
+    cached = _load_profile_cache(cache_path) if cache_path else {}
+    tables: Dict[str, Any] = {
+        path.name: cached[cache_keys[path.name]]
+        for path in csv_paths
+        if cache_keys.get(path.name) in cached
+    }
     errors: List[Dict[str, str]] = []
-    for csv_path in sorted(data_dir.glob("*.csv")):
+    pending_paths = [path for path in csv_paths if path.name not in tables]
+
+    def record(csv_path: Path, profile_fn: Callable[[], Dict[str, Any]]) -> None:
         try:
-            df = pd.read_csv(csv_path)
-            tables[csv_path.name] = _profile_table(df, csv_path.name)
+            tables[csv_path.name] = profile_fn()
         except Exception as exc:
             logger.exception("Failed to profile CSV: %s", csv_path.name)
             error_message = str(exc)
             errors.append({"file": csv_path.name, "error": error_message})
             tables[csv_path.name] = {"error": error_message}
 
+    workers = min(PROFILE_MAX_WORKERS, len(pending_paths))
+    total_bytes = sum(path.stat().st_size for path in pending_paths)
+    if workers > 1 and total_bytes >= PROFILE_PARALLEL_MIN_BYTES:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(_read_and_profile, str(path)) for path in pending_paths]
+            for csv_path, future in zip(pending_paths, futures):
+                record(csv_path, future.result)
+    else:
+        for csv_path in pending_paths:
+            record(csv_path, partial(_read_and_profile, str(csv_path)))
+
+    tables = {path.name: tables[path.name] for path in csv_paths}
+    if cache_path and pending_paths:
+        _write_profile_cache(
+            cache_path,
+            {cache_keys[name]: tbl for name, tbl in tables.items() if "error" not in tbl},
+        )
+
     schema_overview = {
         "table_count": len(tables),
         "tables": [
@@ -492,6 +827,7 @@ def run_report_agent(
     run_id: str,
     silver_run_id: str | None = None,
     model_name: str = "gpt-4.1-mini",
+    use_batch_api: Optional[bool] = None,
 ) -> None:
     """
     Produces two outputs in artifacts/silver/<silver_run_id>/reports/:
@@ -499,6 +835,8 @@ def run_report_agent(
       - silver_run_agent_context.json
     
     If silver_run_id is not provided, generates one from bronze run_id.
+    With use_batch_api (default: the SILVER_REPORT_USE_BATCH_API env var)
+    the human report is requested through the OpenAI Batch API.
     Gracefully handles missing files and LLM failures.
     """
     logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
@@ -541,13 +879,18 @@ def run_report_agent(
         output_dir.mkdir(parents=True, exist_ok=True)
 
         # Read inputs with fallbacks
-        metadata_text = _read_text(metadata_path)
-        log_text = _read_text(log_path)
-        html_text = _read_text(html_report_path)
-        metadata_dict = _read_yaml(metadata_path)
+        # The input files are independent; overlap their reads (helps on network storage)
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            metadata_future = executor.submit(_read_text, metadata_path)
+            log_future = executor.submit(_read_text, log_path)
+            html_future = executor.submit(_read_text, html_report_path)
+            metadata_text = metadata_future.result()
+            log_text = log_future.result()
+            html_text = html_future.result()
+        metadata_dict = _read_yaml(metadata_path, metadata_text)
 
         logger.info("Profiling Bronze run artifacts.")
-        profile = _profile_bronze_run(data_dir)
+        profile = _profile_bronze_run(data_dir, bronze_run_dir / PROFILE_CACHE_NAME)
         profile_md = _render_profile_markdown(profile)
         generated_at = datetime.now(timezone.utc).isoformat()
 
@@ -564,32 +907,41 @@ def run_report_agent(
             _create_fallback_outputs(output_dir, run_id, silver_run_id, profile, generated_at, str(exc))
             return
 
-        # Generate human report with retry
-        human_report_md = _generate_human_report_with_retry(
-            client, model_name, run_id, silver_run_id, 
-            metadata_text, log_text, html_text, profile
-        )
-
-        # Write outputs
+        # Generate human report with retry. The agent context and metadata.yaml do
+        # not depend on the answer, so they are written while the request runs.
+        if use_batch_api is None:
+            use_batch_api = _batch_api_enabled()
         human_report_path = output_dir / "silver_run_human_report.md"
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            report_future = executor.submit(
+                _generate_human_report_with_retry,
+                client, model_name, run_id, silver_run_id,
+                metadata_text, log_text, html_text, profile,
+                use_batch_api=use_batch_api,
+                output_path=human_report_path,
+            )
+
+            # Generate JSON context
+            json_data = _build_agent_context(run_id, silver_run_id, metadata_dict, profile, generated_at)
+            json_out_path = output_dir / "silver_run_agent_context.json"
+            json_out_path.write_text(
+                json.dumps(json_data, indent=2, ensure_ascii=False),
+                encoding="utf-8",
+            )
+            logger.info("Wrote agent context JSON: %s", json_out_path)
+
+            # Create metadata.yaml for Gold Draft Agent compatibility
+            _create_silver_metadata_yaml(silver_run_dir, json_data, generated_at)
+
+            human_report_md = report_future.result()
+
+        # Write outputs (replaces the streamed answer, adding the profiling appendix)
         human_report_path.write_text(
             f"{human_report_md}\n\n{profile_md}",
             encoding="utf-8",
         )
         logger.info("Wrote human-readable report: %s", human_report_path)
 
-        # Generate JSON context
-        json_data = _build_agent_context(run_id, silver_run_id, metadata_dict, profile, generated_at)
-        json_out_path = output_dir / "silver_run_agent_context.json"
-        json_out_path.write_text(
-            json.dumps(json_data, indent=2, ensure_ascii=False),
-            encoding="utf-8",
-        )
-        logger.info("Wrote agent context JSON: %s", json_out_path)
-        
-        # Create metadata.yaml for Gold Draft Agent compatibility
-        _create_silver_metadata_yaml(silver_run_dir, json_data, generated_at)
-        
         elapsed = time.monotonic() - start_time
         logger.info("Completed Silver draft report generation in %.2fs. silver_run_id=%s", elapsed, silver_run_id)
         
@@ -614,7 +966,7 @@ def run_report_agent(
                 }
                 metadata_path = silver_run_dir / "metadata.yaml"
                 with metadata_path.open("w", encoding="utf-8") as f:
-                    yaml.dump(minimal_metadata, f)
+                    yaml.dump(minimal_metadata, f, Dumper=YamlSafeDumper)
             except Exception:
                 pass  # Ignore metadata creation errors in fallback
         except Exception as fallback_exc:
@@ -624,25 +976,26 @@ def run_report_agent(
 
 def _generate_human_report_with_retry(
     client: OpenAI, model_name: str, run_id: str, silver_run_id: str | None,
-    metadata_text: str, log_text: str, html_text: str, profile: Dict[str, Any]
+    metadata_text: str, log_text: str, html_text: str, profile: Dict[str, Any],
+    use_batch_api: bool = False,
+    output_path: Optional[Path] = None,
 ) -> str:
-    """Generate human report with retry logic and fallback."""
+    """Generate human report with retry logic and fallback.
+
+    With ``use_batch_api`` the request first goes through the OpenAI Batch
+    API; if the batch fails, the synchronous retries below still run. With
+    ``output_path`` synchronous responses are streamed into that file as
+    they arrive, so a partial report is visible (and kept) before the call ends.
+    """
     # Performance optimization: truncate large inputs
-    metadata_text = metadata_text[:5000] if len(metadata_text) > 5000 else metadata_text
-    log_text = log_text[:3000] if len(log_text) > 3000 else log_text
-    html_text = html_text[:8000] if len(html_text) > 8000 else html_text
-    profile_text = json.dumps(profile, indent=2)[:10000] if len(json.dumps(profile, indent=2)) > 10000 else json.dumps(profile, indent=2)
+    metadata_text = metadata_text[:5000]
+    log_text = log_text[:3000]
+    html_text = html_text[:8000]
+    # Serialized once; slicing is a no-op for short profiles
+    profile_text = json.dumps(profile, indent=2)[:10000]
     
     human_messages = [
-        {
-            "role": "system",
-            "content": (
-                "You are a senior Data & Analytics expert. "
-                "You produce concise but complete reports for humans. "
-                "Use the following Data Analytics process and catalogues as your guiding framework:\n\n"
-                + PROCESS_DESCRIPTION[:5000]  # Truncate long system prompt
-            ),
-        },
+        {"role": "system", "content": HUMAN_REPORT_SYSTEM_PROMPT},
         {
             "role": "user",
             "content": (
@@ -684,39 +1037,61 @@ def _generate_human_report_with_retry(
         },
     ]
 
-    token_usage = {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
+    token_usage = {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0, "cached_tokens": 0}
+
+    if use_batch_api:
+        try:
+            logger.info("Requesting human-readable report via the OpenAI Batch API.")
+            start_llm = time.monotonic()
+            content, token_usage = _run_batch_chat_completion(
+                client,
+                f"silver_human_report:{silver_run_id or run_id}",
+                {"model": model_name, "messages": human_messages, "max_tokens": 4000},
+            )
+            logger.info("Batch LLM call completed in %.2fs, tokens: %s", time.monotonic() - start_llm, token_usage)
+            return content
+        except Exception as exc:
+            logger.warning("OpenAI batch request failed, falling back to synchronous calls: %s", exc)
     
     for attempt in range(3):  # 3 retry attempts
         try:
             logger.info("Requesting human-readable report from OpenAI (attempt %d/3).", attempt + 1)
             start_llm = time.monotonic()
             
-            human_resp = client.chat.completions.create(
-                model=model_name,
-                messages=human_messages,
-                timeout=60,  # 60 second timeout
-                max_tokens=4000,  # Limit response size for performance
-            )
+            request = {
+                "model": model_name,
+                "messages": human_messages,
+                "timeout": 60,  # 60 second timeout
+                "max_tokens": 4000,  # Limit response size for performance
+            }
+            if output_path is None:
+                human_resp = client.chat.completions.create(**request)
+                content = human_resp.choices[0].message.content or ""
+                usage = getattr(human_resp, "usage", None)
+            else:
+                content, usage = _stream_completion_to_file(client, output_path, **request)
             
             llm_duration = time.monotonic() - start_llm
             
             # Track token usage for monitoring
-            if hasattr(human_resp, 'usage') and human_resp.usage:
+            if usage:
+                details = getattr(usage, "prompt_tokens_details", None)
                 token_usage = {
-                    "prompt_tokens": human_resp.usage.prompt_tokens,
-                    "completion_tokens": human_resp.usage.completion_tokens,
-                    "total_tokens": human_resp.usage.total_tokens,
+                    "prompt_tokens": usage.prompt_tokens,
+                    "completion_tokens": usage.completion_tokens,
+                    "total_tokens": usage.total_tokens,
+                    "cached_tokens": getattr(details, "cached_tokens", 0) or 0,
                 }
             
             logger.info("LLM call completed in %.2fs, tokens: %s", llm_duration, token_usage)
-            return human_resp.choices[0].message.content or ""
+            return content
             
         except Exception as exc:
             logger.warning("OpenAI call failed (attempt %d/3): %s", attempt + 1, exc)
             if attempt == 2:  # Last attempt
                 logger.error("All OpenAI attempts failed, using fallback report")
                 return _create_fallback_human_report(run_id, silver_run_id, profile)
-            time.sleep(2 ** attempt)  # Exponential backoff
+            time.sleep(min(LLM_RETRY_MAX_DELAY_S, 2 ** attempt + random.random()))
 
 
 def _create_fallback_human_report(run_id: str, silver_run_id: str | None, profile: Dict[str, Any]) -> str:
@@ -770,10 +1145,17 @@ def _build_agent_context(run_id: str, silver_run_id: str | None, metadata_dict:
             "schema_out": tmeta.get("schema_out", []),
         }
 
-    # Performance metrics
-    total_rows = sum(t.get("row_count", 0) for t in profile.get("tables", {}).values() if "error" not in t)
-    total_columns = sum(t.get("column_count", 0) for t in profile.get("tables", {}).values() if "error" not in t)
-    
+    # Performance metrics, gathered in a single pass over the profiled tables
+    total_rows = total_columns = tables_processed = tables_failed = 0
+    for table_profile in profile.get("tables", {}).values():
+        if "error" in table_profile:
+            tables_failed += 1
+            continue
+        tables_processed += 1
+        total_rows += table_profile.get("row_count", 0)
+        total_columns += table_profile.get("column_count", 0)
+    errors = profile.get("errors", [])
+
     return {
         "run_id": run_id,
         "silver_run_id": silver_run_id,
@@ -787,14 +1169,14 @@ def _build_agent_context(run_id: str, silver_run_id: str | None, metadata_dict:
         "bronze_tables": tables,
         "profile": profile,
         "schema_overview": profile.get("schema_overview"),
-        "has_errors": len(profile.get("errors", [])) > 0,
-        "error_count": len(profile.get("errors", [])),
+        "has_errors": len(errors) > 0,
+        "error_count": len(errors),
         # Performance metrics for monitoring
         "performance_metrics": {
             "total_rows_processed": total_rows,
             "total_columns_processed": total_columns,
-            "tables_processed": len([t for t in profile.get("tables", {}).values() if "error" not in t]),
-            "tables_failed": len([t for t in profile.get("tables", {}).values() if "error" in t]),
+            "tables_processed": tables_processed,
+            "tables_failed": tables_failed,
         },
     }
 
@@ -831,7 +1213,7 @@ def _create_silver_metadata_yaml(silver_run_dir: Path, json_data: Dict[str, Any]
     
     metadata_path = silver_run_dir / "metadata.yaml"
     with metadata_path.open("w", encoding="utf-8") as f:
-        yaml.dump(metadata_yaml, f, default_flow_style=False, sort_keys=False)
+        yaml.dump(metadata_yaml, f, Dumper=YamlSafeDumper, default_flow_style=False, sort_keys=False)
     
     logger.info("Created Silver metadata.yaml: %s", metadata_path)
 
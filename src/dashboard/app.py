@@ -4,7 +4,7 @@ from typing import Iterable
 
 import streamlit as st
 
-from src.dashboard.components.filters import apply_filters, configure_filters
+from src.dashboard.components.filters import apply_filters_cached, configure_filters
 from src.dashboard.components.kpis import render_kpi_deck, summarize_changes
 from src.dashboard.components.charts import (
     render_trend_chart,
@@ -46,10 +46,10 @@ def _prepare_state() -> None:
 
 def _setup_sidebar(state) -> dict | None:
     filters = None
-    if state.enriched is not None and state.product_lookup is not None:
-        filters = configure_filters(state.enriched, state.missing_info, state.product_lookup)
+    if state.enriched is not None and state.product_labels is not None:
+        filters = configure_filters(state.enriched, state.missing_info, state.product_labels)
         persist_filters(filters)
-        filtered = apply_filters(state.enriched, filters)
+        filtered = apply_filters_cached(state.enriched, filters, state.selected_run.run_id)
         persist_filtered_dataset(filtered)
     else:
         st.sidebar.warning("Waiting for Silver artifacts to populate filters.")
@@ -1,19 +1,35 @@
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
 import streamlit as st
 
+from src.dashboard.services.data_processing import MISSING_DATE_ORDINAL, WEEKDAY_DTYPE, WEEKDAYS
+
+# Plotly is imported inside the render_* functions: every page imports this
+# module, but only the overview draws charts (plotly.express alone costs ~0.15s).
+PRICE_BUCKETS = 10
+
+
+def _daily_revenue(filtered: pd.DataFrame) -> pd.DataFrame:
+    """Revenue per order date, summed with ``bincount`` over the precomputed day ordinals."""
+    ordinals = filtered["order_date_ordinal"].to_numpy()
+    sales = filtered["sls_sales"].to_numpy(dtype="float64", na_value=np.nan)
+    valid = (ordinals != MISSING_DATE_ORDINAL) & ~np.isnan(sales)
+    days, day_index = np.unique(ordinals[valid], return_inverse=True)
+    return pd.DataFrame(
+        {
+            "order_date": pd.DatetimeIndex(days.astype("datetime64[D]")).date,
+            "sls_sales": np.bincount(day_index, weights=sales[valid], minlength=days.size),
+        }
+    )
+
 
 def render_trend_chart(filtered: pd.DataFrame) -> None:
+    import plotly.express as px
+
     st.subheader("Revenue trajectory (daily)")
-    time_series = (
-        filtered.dropna(subset=["order_dt", "sls_sales"])
-        .assign(order_date=lambda df: df["order_dt"].dt.date)
-        .groupby("order_date", as_index=False)["sls_sales"]
-        .sum()
-    )
+    time_series = _daily_revenue(filtered)
     if time_series.empty:
         st.info("No revenue data available for the selected window.")
         return
@@ -31,16 +47,60 @@ def render_trend_chart(filtered: pd.DataFrame) -> None:
     st.plotly_chart(fig, use_container_width=True)
 
 
+def _codes_and_labels(series: pd.Series) -> tuple[np.ndarray, pd.Index]:
+    """Integer codes (-1 for missing) and their labels; Categoricals reuse their own codes."""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return series.cat.codes.to_numpy(), series.cat.categories
+    return pd.factorize(series, sort=True)
+
+
+def _product_line_revenue(filtered: pd.DataFrame) -> pd.DataFrame:
+    """Revenue per product line (lines without any sales value are omitted)."""
+    line_codes, lines = _codes_and_labels(filtered["product_line"])
+    sales = filtered["sls_sales"].to_numpy(dtype="float64", na_value=np.nan)
+    valid = (line_codes >= 0) & ~np.isnan(sales)
+    counts = np.bincount(line_codes[valid], minlength=len(lines))
+    totals = np.bincount(line_codes[valid], weights=sales[valid], minlength=len(lines))
+    observed = np.flatnonzero(counts)
+    return pd.DataFrame({"product_line": lines[observed], "sls_sales": totals[observed]})
+
+
+def _weekday_country_revenue(filtered: pd.DataFrame) -> pd.DataFrame:
+    """Weekday x country revenue matrix, accumulated in place with ``np.add.at``.
+
+    Weekdays come from the codes of the load-time ``order_day`` Categorical.
+
+    Rows and columns are limited to the weekdays and countries that occur with a
+    revenue value; cells without orders are 0.
+    """
+    order_day = filtered["order_day"]
+    if order_day.dtype != WEEKDAY_DTYPE:
+        order_day = order_day.astype(WEEKDAY_DTYPE)
+    weekday_codes = order_day.cat.codes.to_numpy()
+    country_codes, countries = _codes_and_labels(filtered["country"])
+    sales = filtered["sls_sales"].to_numpy(dtype="float64", na_value=np.nan)
+    valid = (weekday_codes >= 0) & (country_codes >= 0) & ~np.isnan(sales)
+    cells = (weekday_codes[valid], country_codes[valid])
+    revenue = np.zeros((len(WEEKDAYS), len(countries)), dtype=np.float64)
+    seen = np.zeros(revenue.shape, dtype=bool)
+    np.add.at(revenue, cells, sales[valid])
+    seen[cells] = True
+    rows, columns = seen.any(axis=1), seen.any(axis=0)
+    return pd.DataFrame(
+        revenue[np.ix_(rows, columns)],
+        index=pd.Index(np.asarray(WEEKDAYS)[rows], name="order_day"),
+        columns=pd.Index(countries[columns], name="country"),
+    )
+
+
 def render_product_mix_geo(filtered: pd.DataFrame) -> None:
+    import plotly.express as px
+    import plotly.graph_objects as go
+
     st.subheader("Product-line mix & geopolitical heatmap")
     col1, col2 = st.columns(2)
     with col1:
-        product_summary = (
-            filtered[["product_line", "sls_sales"]]
-            .dropna()
-            .groupby("product_line", as_index=False)["sls_sales"]
-            .sum()
-        )
+        product_summary = _product_line_revenue(filtered)
         if product_summary.empty:
             st.info("No product lines match the current selection.")
         else:
@@ -83,16 +143,7 @@ def render_product_mix_geo(filtered: pd.DataFrame) -> None:
             st.plotly_chart(fig_waterfall, use_container_width=True)
 
     with col2:
-        heatmap_source = (
-            filtered.dropna(subset=["order_day", "country", "sls_sales"])
-            .groupby(["order_day", "country"], as_index=False)["sls_sales"]
-            .sum()
-        )
-        weekdays = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
-        heatmap_source["order_day"] = pd.Categorical(
-            heatmap_source["order_day"], categories=weekdays, ordered=True
-        )
-        pivot = heatmap_source.pivot(index="order_day", columns="country", values="sls_sales").fillna(0)
+        pivot = _weekday_country_revenue(filtered)
         if pivot.empty:
             st.info("Heatmap requires data with country, weekday, and revenue.")
         else:
@@ -107,30 +158,61 @@ def render_product_mix_geo(filtered: pd.DataFrame) -> None:
             st.plotly_chart(fig_heat, use_container_width=True)
 
 
+def _price_bucket_summary(filtered: pd.DataFrame, bins: int = PRICE_BUCKETS) -> pd.DataFrame:
+    """Per price bucket: mean price, median quantity and distinct orders.
+
+    Buckets are the equal-width, right-closed intervals of ``pd.cut(..., bins=bins,
+    include_lowest=True)``, assigned with ``searchsorted`` on the NumPy arrays;
+    empty buckets are omitted.
+    """
+    prices = filtered["sls_price"].to_numpy(dtype="float64", na_value=np.nan)
+    quantities = filtered["sls_quantity"].to_numpy(dtype="float64", na_value=np.nan)
+    valid = ~np.isnan(prices) & ~np.isnan(quantities)
+    prices, quantities = prices[valid], quantities[valid]
+    if prices.size == 0:
+        return pd.DataFrame(columns=["price_bucket", "price_mean", "quantity_median", "transactions"])
+
+    low, high = prices.min(), prices.max()
+    if low == high:
+        buckets = np.zeros(prices.size, dtype=np.intp)
+    else:
+        edges = np.linspace(low, high, bins + 1)
+        buckets = np.searchsorted(edges[1:-1], prices, side="left")
+    counts = np.bincount(buckets, minlength=bins)
+    observed = np.flatnonzero(counts)
+    price_means = np.bincount(buckets, weights=prices, minlength=bins)[observed] / counts[observed]
+
+    # One stable sort groups quantities by bucket; each median is then a contiguous slice
+    order = np.argsort(buckets, kind="stable")
+    sorted_quantities = quantities[order]
+    bounds = np.concatenate(([0], np.cumsum(counts)))
+    quantity_medians = [np.median(sorted_quantities[bounds[b] : bounds[b + 1]]) for b in observed]
+
+    # Distinct orders per bucket: unique (bucket, order code) pairs, counted per bucket
+    order_codes, order_numbers = _codes_and_labels(filtered["sls_ord_num"])
+    order_codes = order_codes[valid]
+    has_order = order_codes >= 0
+    pairs = np.unique(buckets[has_order] * len(order_numbers) + order_codes[has_order])
+    transactions = np.bincount(pairs // max(len(order_numbers), 1), minlength=bins)
+    return pd.DataFrame(
+        {
+            "price_bucket": observed,
+            "price_mean": price_means,
+            "quantity_median": quantity_medians,
+            "transactions": transactions[observed],
+        }
+    )
+
+
 def render_order_signals(filtered: pd.DataFrame) -> None:
+    import plotly.express as px
+
     st.subheader("Order Signals")
-    agg = (
-        filtered.dropna(subset=["sls_price", "sls_quantity"])
-        .assign(
-            price_bucket=lambda df: pd.cut(
-                df["sls_price"],
-                bins=10,
-                include_lowest=True,
-                labels=False,
-            )
-        )
-    )
-    if agg.empty:
+    bucket_summary = _price_bucket_summary(filtered)
+    if bucket_summary.empty:
         st.info("No price/quantity information available with the active filters.")
         return
 
-    bucket_summary = (
-        agg.groupby("price_bucket", as_index=False).agg(
-            price_mean=("sls_price", "mean"),
-            quantity_median=("sls_quantity", "median"),
-            transactions=("sls_ord_num", "nunique"),
-        )
-    )
     bucket_summary["price_bucket_label"] = bucket_summary["price_mean"].round(0).map(
         lambda v: f"€{int(v):,}"
     )
@@ -148,6 +230,19 @@ def render_order_signals(filtered: pd.DataFrame) -> None:
     st.plotly_chart(fig_bucket, use_container_width=True)
 
 
+def latest_rows(filtered: pd.DataFrame, n: int) -> pd.DataFrame:
+    """Equivalent of ``sort_values("order_dt", ascending=False).head(n)`` without sorting every row.
+
+    ``argpartition`` picks the ``n`` most recent rows in O(N) and only those are
+    sorted; NaT is the smallest int64, so undated rows still come last.
+    """
+    if len(filtered) <= n:
+        return filtered.sort_values("order_dt", ascending=False)
+    timestamps = filtered["order_dt"].to_numpy(dtype="datetime64[ns]").view("int64")
+    newest = np.argpartition(timestamps, len(timestamps) - n)[-n:]
+    return filtered.iloc[newest].sort_values("order_dt", ascending=False)
+
+
 def render_row_sample(filtered: pd.DataFrame) -> None:
     st.subheader("Filtered sample")
     if filtered.empty:
@@ -155,7 +250,7 @@ def render_row_sample(filtered: pd.DataFrame) -> None:
         return
 
     st.dataframe(
-        filtered.sort_values("order_dt", ascending=False)[
+        latest_rows(filtered, 10)[
             [
                 "sls_ord_num",
                 "order_dt",
@@ -165,6 +260,6 @@ def render_row_sample(filtered: pd.DataFrame) -> None:
                 "sls_quantity",
                 "sls_price",
             ]
-        ].head(10),
+        ],
         use_container_width=True,
     )
@@ -3,10 +3,14 @@ from __future__ import annotations
 from datetime import date
 from typing import Sequence
 
+import numpy as np
 import pandas as pd
 import streamlit as st
 
-from src.dashboard.services.data_processing import resolve_product_name
+from src.dashboard.services.data_processing import to_date_ordinals
+
+FILTER_CACHE_STATE_KEY = "dashboard_filter_cache"
+FILTER_CACHE_MAX_ENTRIES = 8
 
 
 def session_multiselect(label: str, options: Sequence[str], key: str, default: Sequence[str], help_text: str | None = None) -> list[str]:
@@ -42,7 +46,7 @@ def session_range_slider(key: str, label: str, min_value: float, max_value: floa
 def configure_filters(
     enriched: pd.DataFrame,
     missing_info: dict[str, int],
-    product_lookup: tuple[dict[str, str], dict[str, str]],
+    product_labels: dict[str, str],
 ) -> dict[str, Sequence]:
     """Render the sidebar filters and capture selections."""
     st.sidebar.header("🧭 Dashboard filters")
@@ -85,13 +89,8 @@ def configure_filters(
     )
     fallback_keys = enriched["sls_prd_key"].dropna().unique()
     key_set = sorted(available_keys) if available_keys.size else sorted(fallback_keys)
-    label_options = []
-    label_to_key: dict[str, str] = {}
-    for key in key_set:
-        name = resolve_product_name(key, product_lookup)
-        label = f"{name} ({key})" if name else key
-        label_options.append(label)
-        label_to_key[label] = key
+    label_options = [product_labels[key] for key in key_set]
+    label_to_key = dict(zip(label_options, key_set))
     selected_labels = session_multiselect(
         "Product names (hierarchical)",
         label_options,
@@ -189,25 +188,86 @@ def configure_filters(
     return filters
 
 
+def _range_mask(series: pd.Series, bounds: Sequence[float]) -> np.ndarray:
+    """Inclusive range test on a float view; NaN compares False, so missing values drop out."""
+    low, high = bounds
+    values = series.to_numpy(dtype="float64", na_value=np.nan)
+    return (values >= low) & (values <= high)
+
+
+def _isin_mask(series: pd.Series, selected: Sequence) -> np.ndarray | None:
+    """Membership test; Categoricals gather from a per-category boolean lookup by code.
+
+    Returns None when every category is selected and no value is missing, i.e.
+    when the predicate would be all True (the sidebar's default state).
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        categories = series.cat.categories
+        # One extra trailing slot stays False: missing values have code -1
+        allowed = np.zeros(len(categories) + 1, dtype=bool)
+        wanted = categories.get_indexer(list(selected))
+        allowed[wanted[wanted >= 0]] = True
+        codes = series.cat.codes.to_numpy()
+        if allowed[:-1].all() and (codes.size == 0 or codes.min() >= 0):
+            return None
+        return allowed[codes]
+    # Hash-based isin: np.isin sorts object arrays and cannot order mixed str/NaN
+    return series.isin(selected).to_numpy()
+
+
 def apply_filters(df: pd.DataFrame, filters: dict[str, Sequence]) -> pd.DataFrame:
-    """Apply the sidebar filters to the enriched sales data."""
-    mask = df["order_dt"].notna()
-    start_date, end_date = filters["date_range"]
-    mask &= df["order_dt"].dt.date >= start_date
-    mask &= df["order_dt"].dt.date <= end_date
-    mask &= df["product_line"].isin(filters["product_lines"])
-    mask &= df["sls_prd_key"].isin(filters["product_keys"])
-    mask &= df["country"].isin(filters["countries"])
-    mask &= df["customer_gender"].isin(filters["genders"])
-    mask &= df["customer_marital_status"].isin(filters["marital_status"])
-
-    sales_low, sales_high = filters["sales_range"]
-    mask &= df["sls_sales"].between(sales_low, sales_high).fillna(False)
-
-    price_low, price_high = filters["price_range"]
-    mask &= df["sls_price"].between(price_low, price_high).fillna(False)
-
-    quantity_low, quantity_high = filters["quantity_range"]
-    mask &= df["sls_quantity"].between(quantity_low, quantity_high).fillna(False)
-
-    return df.loc[mask].copy()
+    """Apply the sidebar filters to the enriched sales data.
+
+    Every predicate is evaluated to a NumPy boolean array and folded in a single
+    ``logical_and.reduce``; dates are compared on the precomputed int32
+    ``order_date_ordinal`` column (missing dates are never in range). Membership
+    filters that keep every category are left out of the reduction.
+
+    Boolean indexing already yields a new frame, so no extra ``.copy()`` is made;
+    the result is cached and shared across pages, which only read from it.
+    """
+    start_ordinal, end_ordinal = to_date_ordinals(list(filters["date_range"]))
+    order_days = df["order_date_ordinal"].to_numpy()
+    membership = [
+        _isin_mask(df["product_line"], filters["product_lines"]),
+        _isin_mask(df["sls_prd_key"], filters["product_keys"]),
+        _isin_mask(df["country"], filters["countries"]),
+        _isin_mask(df["customer_gender"], filters["genders"]),
+        _isin_mask(df["customer_marital_status"], filters["marital_status"]),
+    ]
+    predicates = [
+        order_days >= start_ordinal,
+        order_days <= end_ordinal,
+        *(predicate for predicate in membership if predicate is not None),
+        _range_mask(df["sls_sales"], filters["sales_range"]),
+        _range_mask(df["sls_price"], filters["price_range"]),
+        _range_mask(df["sls_quantity"], filters["quantity_range"]),
+    ]
+    mask = np.logical_and.reduce(predicates)
+    return df.loc[mask]
+
+
+def filters_cache_key(filters: dict[str, Sequence]) -> tuple:
+    """Canonical, hashable form of a filter dict (lists become tuples, keys sorted)."""
+    return tuple(
+        (name, tuple(value) if isinstance(value, (list, tuple)) else value)
+        for name, value in sorted(filters.items())
+    )
+
+
+def apply_filters_cached(df: pd.DataFrame, filters: dict[str, Sequence], dataset_key: str) -> pd.DataFrame:
+    """Return the filtered view from session state when this dataset/filter combo was already applied.
+
+    Streamlit reruns the whole script on every widget touch; ``dataset_key`` (the run id)
+    identifies the enriched frame, which is rebuilt as a new object on each rerun.
+    """
+    cache: dict[tuple, pd.DataFrame] = st.session_state.setdefault(FILTER_CACHE_STATE_KEY, {})
+    key = (dataset_key, filters_cache_key(filters))
+    if key in cache:
+        cache[key] = cache.pop(key)
+        return cache[key]
+    filtered = apply_filters(df, filters)
+    cache[key] = filtered
+    while len(cache) > FILTER_CACHE_MAX_ENTRIES:
+        cache.pop(next(iter(cache)))
+    return filtered
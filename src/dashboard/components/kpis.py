@@ -3,16 +3,19 @@ from __future__ import annotations
 import pandas as pd
 import streamlit as st
 
+from src.dashboard.services.data_processing import BaselineAggregates
 
-def render_kpi_deck(filtered: pd.DataFrame, full: pd.DataFrame) -> None:
-    """Display executive KPIs with deltas compared to the full run."""
+
+def _deck_totals(frame: pd.DataFrame) -> tuple[float, int, int]:
+    """Revenue, distinct orders, and distinct customers of a frame."""
+    return float(frame["sls_sales"].sum()), frame["sls_ord_num"].nunique(), frame["sls_cust_id"].nunique()
+
+
+def render_kpi_deck(filtered: pd.DataFrame, baseline: BaselineAggregates) -> None:
+    """Display executive KPIs with deltas compared to the full run's precomputed aggregates."""
     st.markdown("### KPI deck & filter coverage")
-    filtered_revenue = float(filtered["sls_sales"].sum())
-    full_revenue = float(full["sls_sales"].sum())
-    filtered_orders = filtered["sls_ord_num"].nunique()
-    full_orders = full["sls_ord_num"].nunique()
-    filtered_customers = filtered["sls_cust_id"].nunique()
-    full_customers = full["sls_cust_id"].nunique()
+    filtered_revenue, filtered_orders, filtered_customers = _deck_totals(filtered)
+    full_revenue, full_orders, full_customers = baseline.revenue, baseline.orders, baseline.customers
     avg_order_value = filtered_revenue / filtered_orders if filtered_orders else 0.0
     baseline_avg = full_revenue / full_orders if full_orders else 0.0
 
@@ -39,38 +42,36 @@ def render_kpi_deck(filtered: pd.DataFrame, full: pd.DataFrame) -> None:
     )
 
 
-def summarize_changes(filtered: pd.DataFrame, baseline: pd.DataFrame) -> list[str]:
-    """Create a short bullet trail describing what changed in this view."""
+def _top_line(frame: pd.DataFrame) -> tuple[str, float] | None:
+    """Best-selling product line and its revenue, or None without product lines."""
+    top_lines = (
+        frame.groupby("product_line", as_index=False, observed=True)["sls_sales"]
+        .sum()
+        .sort_values("sls_sales", ascending=False)
+    )
+    if top_lines.empty:
+        return None
+    return top_lines.iloc[0]["product_line"], top_lines.iloc[0]["sls_sales"]
+
+
+def summarize_changes(filtered: pd.DataFrame, baseline: BaselineAggregates) -> list[str]:
+    """Create a short bullet trail describing what changed in this view.
+
+    Only the filtered view is aggregated; the full-run side comes from ``baseline``.
+    """
     bullets: list[str] = []
     filtered_revenue = filtered["sls_sales"].sum()
-    baseline_revenue = baseline["sls_sales"].sum()
+    baseline_revenue, baseline_top_sales = baseline.revenue, baseline.top_line_revenue
     if baseline_revenue:
         delta = filtered_revenue - baseline_revenue
         pct = (delta / baseline_revenue) * 100
         bullets.append(f"Revenue view is {delta:+,.0f}€ ({pct:+.1f}%) vs. the full run.")
-    if not filtered.empty and not baseline.empty:
-        top_line_filtered = (
-            filtered.groupby("product_line", as_index=False)["sls_sales"]
-            .sum()
-            .sort_values("sls_sales", ascending=False)
-        )
-        top_line_baseline = (
-            baseline.groupby("product_line", as_index=False)["sls_sales"]
-            .sum()
-            .sort_values("sls_sales", ascending=False)
-        )
-        if not top_line_filtered.empty:
-            line = top_line_filtered.iloc[0]["product_line"]
-            filtered_share = (
-                top_line_filtered.iloc[0]["sls_sales"] / filtered_revenue * 100
-                if filtered_revenue
-                else 0.0
-            )
-            baseline_share = (
-                top_line_baseline.iloc[0]["sls_sales"] / baseline_revenue * 100
-                if baseline_revenue
-                else 0.0
-            )
+    if not filtered.empty:
+        top = _top_line(filtered)
+        if top is not None:
+            line, top_sales = top
+            filtered_share = top_sales / filtered_revenue * 100 if filtered_revenue else 0.0
+            baseline_share = baseline_top_sales / baseline_revenue * 100 if baseline_revenue else 0.0
             bullets.append(
                 f"Top line '{line}' contributes {filtered_share:.1f}% of filtered revenue vs {baseline_share:.1f}% baseline."
             )
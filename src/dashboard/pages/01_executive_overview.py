@@ -51,9 +51,9 @@ def main() -> None:
         st.warning("Filterwerte werden initialisiert. Bitte wählen Sie einen Bereich im Sidebar.")
         return
 
-    render_kpi_deck(filtered, state.enriched)
+    render_kpi_deck(filtered, state.baseline)
     st.markdown("### What changed in this view")
-    change_notes = summarize_changes(filtered, state.enriched)
+    change_notes = summarize_changes(filtered, state.baseline)
     if change_notes:
         for note in change_notes:
             st.write(f"- {note}")
@@ -2,16 +2,20 @@ from __future__ import annotations
 
 import streamlit as st
 
-from src.dashboard.context import get_dashboard_state, get_filtered_dataset
+from src.dashboard.components.charts import latest_rows
+from src.dashboard.components.filters import filters_cache_key
+from src.dashboard.context import get_dashboard_state, get_filtered_dataset, get_persisted_filters
+from src.dashboard.services.data_processing import top_n_by
 
 
-def _render_top_n(filtered, column, top=5):
-    summary = (
-        filtered.groupby(column, as_index=False)["sls_sales"]
-        .sum()
-        .sort_values("sls_sales", ascending=False)
-        .head(top)
-    )
+@st.cache_data(show_spinner=False, max_entries=48)
+def _cached_top_n(run_id, filter_key, column, top, _filtered):
+    """``top_n_by`` per run, filter selection, and column; the filtered frame is not hashed."""
+    return top_n_by(_filtered, column, top)
+
+
+def _render_top_n(filtered, column, cache_key, top=5):
+    summary = _cached_top_n(*cache_key, column, top, filtered)
     st.table(summary.assign(sls_sales=lambda df: df["sls_sales"].map(lambda v: f"€{v:,.0f}")))
 
 
@@ -29,16 +33,24 @@ def main() -> None:
     st.markdown("Interactive data preview & top performers for the active filters.")
 
     st.subheader("Filtered data snapshot")
-    st.dataframe(filtered.sort_values("order_dt", ascending=False).head(100), use_container_width=True)
+    st.dataframe(
+        latest_rows(filtered, 100),
+        use_container_width=True,
+        column_config={
+            "order_date": st.column_config.DateColumn("order_date"),
+            "order_week": st.column_config.DateColumn("order_week"),
+        },
+    )
 
     st.subheader("Top performers")
+    cache_key = (state.selected_run.run_id, filters_cache_key(get_persisted_filters() or {}))
     cols = st.columns(3)
     with cols[0]:
         st.caption("Top products")
-        _render_top_n(filtered, "product_name")
+        _render_top_n(filtered, "product_name", cache_key)
     with cols[1]:
         st.caption("Top countries")
-        _render_top_n(filtered, "country")
+        _render_top_n(filtered, "country", cache_key)
     with cols[2]:
         st.caption("Top customers")
-        _render_top_n(filtered, "sls_cust_id")
+        _render_top_n(filtered, "sls_cust_id", cache_key)
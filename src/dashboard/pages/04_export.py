@@ -5,7 +5,15 @@ from datetime import datetime
 
 import streamlit as st
 
+from src.dashboard.components.filters import filters_cache_key
 from src.dashboard.context import get_dashboard_state, get_filtered_dataset, get_persisted_filters
+from src.dashboard.services.artifacts import frame_to_csv_bytes
+
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def _cached_csv(run_id, filter_key, _filtered):
+    """CSV export per run and filter selection; the filtered frame is not hashed."""
+    return frame_to_csv_bytes(_filtered)
 
 
 def _serialize_filters(filters: dict[str, object]) -> dict[str, object]:
@@ -33,7 +41,7 @@ def main() -> None:
         st.warning("Filtered data is not yet available.")
         return
 
-    csv_data = filtered.to_csv(index=False).encode("utf-8")
+    csv_data = _cached_csv(state.selected_run.run_id, filters_cache_key(filters or {}), filtered)
     st.download_button(
         label="Download filtered dataset (CSV)",
         data=csv_data,
@@ -27,8 +27,9 @@ class RunLocation:
         )
 
 
+@lru_cache(maxsize=None)
 def find_repo_root() -> Path:
-    """Walk upward until we find a repo containing `src/` and `artifacts/`."""
+    """Walk upward until we find a repo containing `src/` and `artifacts/` (once per process)."""
     current = Path(__file__).resolve()
     while current != current.parent:
         if (current / "src").exists() and (current / "artifacts").exists():
@@ -92,6 +93,35 @@ def explain_missing_artifacts() -> str:
     )
 
 
+# Per-file read_csv options; sales dates are parsed while reading so the
+# dashboard's to_datetime pass only has to coerce leftovers. Text columns are
+# pinned to str: pyarrow would otherwise turn date-like strings into dates and
+# numeric-looking keys into numbers where the C parser keeps strings.
+CSV_READ_OPTIONS: dict[str, dict] = {
+    "sales_details.csv": {
+        "parse_dates": ["sls_order_dt", "sls_ship_dt", "sls_due_dt"],
+        "dtype": {"sls_ord_num": "str", "sls_prd_key": "str"},
+    },
+    "prd_info.csv": {
+        "dtype": {column: "str" for column in ("prd_key", "prd_nm", "prd_line", "prd_start_dt", "prd_end_dt")},
+    },
+    "cst_info.csv": {
+        "dtype": {
+            column: "str"
+            for column in (
+                "cst_key",
+                "cst_firstname",
+                "cst_lastname",
+                "cst_marital_status",
+                "cst_gndr",
+                "cst_create_date",
+            )
+        },
+    },
+    "LOC_A101.csv": {"dtype": {"CID": "str", "CNTRY": "str"}},
+}
+
+
 @lru_cache(maxsize=64)
 def _load_yaml(path: Path) -> dict | None:
     if not path.exists():
@@ -100,9 +130,40 @@ def _load_yaml(path: Path) -> dict | None:
         return yaml.safe_load(source) or {}
 
 
+def _read_csv_pyarrow(path: Path, options: dict) -> pd.DataFrame:
+    """Read a CSV with pyarrow's multithreaded reader, applying ``options`` while converting.
+
+    pandas' ``engine="pyarrow"`` only casts ``dtype`` after pyarrow has inferred a
+    type (``"00123"`` is already the number 123 by then), so the pinned types go
+    into pyarrow's convert options instead, next to pandas' default NA tokens.
+    """
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    from pandas._libs.parsers import STR_NA_VALUES
+
+    column_types = {column: pa.string() for column, dtype in options.get("dtype", {}).items() if dtype == "str"}
+    column_types.update({column: pa.timestamp("us") for column in options.get("parse_dates", [])})
+    convert_options = pacsv.ConvertOptions(
+        column_types=column_types,
+        null_values=sorted(STR_NA_VALUES),
+        strings_can_be_null=True,
+    )
+    table = pacsv.read_csv(path, convert_options=convert_options)
+    # All-empty columns come back as Arrow's null type; the C parser reads them as float NaN
+    schema = pa.schema([field.with_type(pa.float64()) if pa.types.is_null(field.type) else field for field in table.schema])
+    return table.cast(schema).to_pandas()
+
+
 @lru_cache(maxsize=64)
 def _load_csv(path: Path) -> pd.DataFrame:
-    return pd.read_csv(path)
+    """Read a Silver table with pyarrow's multithreaded CSV reader, parsing known date columns."""
+    options = CSV_READ_OPTIONS.get(path.name, {})
+    try:
+        return _read_csv_pyarrow(path, options)
+    except (ImportError, ValueError):
+        # pyarrow rejects ragged or oddly quoted files (ArrowInvalid is a ValueError)
+        # and dates it cannot parse; the C parser tolerates both
+        return pd.read_csv(path, **options)
 
 
 def load_run_metadata(run_location: RunLocation) -> dict:
@@ -129,6 +190,11 @@ def load_required_tables(run_location: RunLocation) -> dict[str, pd.DataFrame] |
     return tables
 
 
+def frame_to_csv_bytes(df: pd.DataFrame) -> bytes:
+    """Serialize a frame to UTF-8 CSV exactly as ``DataFrame.to_csv`` writes it (no index)."""
+    return df.to_csv(index=False).encode("utf-8")
+
+
 def explain_layout(run_location: RunLocation | None) -> str:
     if run_location is None:
         return "No run selected."
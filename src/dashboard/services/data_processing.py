@@ -1,10 +1,28 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Tuple
 
+import numpy as np
 import pandas as pd
 
+# Repeated string columns, stored as Categoricals so filter membership tests,
+# groupbys and distinct counts work on integer codes instead of Python strings.
+CATEGORY_COLUMNS = (
+    "product_line",
+    "product_name",
+    "country",
+    "customer_gender",
+    "customer_marital_status",
+    "sls_prd_key",
+    "sls_ord_num",
+)
+WEEKDAYS = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+WEEKDAY_DTYPE = pd.CategoricalDtype(WEEKDAYS, ordered=True)
+# `order_date_ordinal` value for rows without an order date; never inside a date range.
+MISSING_DATE_ORDINAL = np.iinfo(np.int32).min
+
 
 def parse_iso_timestamp(value: str | None) -> datetime | None:
     """Convert ISO timestamps (possibly with Z suffix) into aware datetimes."""
@@ -15,21 +33,35 @@ def parse_iso_timestamp(value: str | None) -> datetime | None:
     return datetime.fromisoformat(value)
 
 
+def parse_iso_timestamp_series(values: pd.Series) -> pd.Series:
+    """Vectorized ``parse_iso_timestamp`` for a column of ISO strings.
+
+    Parses the whole column in one pass into UTC timestamps; naive values are
+    taken as UTC and unparseable or empty values become ``NaT``.
+    """
+    normalized = values.astype("str").str.replace("Z", "+00:00", regex=False)
+    return pd.to_datetime(normalized, utc=True, errors="coerce", format="ISO8601")
+
+
 def build_product_lookup(product_df: pd.DataFrame) -> tuple[dict[str, str], dict[str, str]]:
-    """Build direct/suffix lookups for product keys."""
-    direct: dict[str, str] = {}
+    """Build direct/suffix lookups for product keys.
+
+    Keys and labels are pulled out as plain lists once; only the suffix
+    expansion loops in Python. Rows without a key are skipped and rows without
+    a name fall back to the key as label.
+    """
+    products = product_df[product_df["prd_key"].notna()]
+    keys = products["prd_key"].astype(str).to_numpy()
+    names = products["prd_nm"].fillna("").astype(str).to_numpy()
+    has_key = keys != ""
+    keys, names = keys[has_key].tolist(), names[has_key]
+    labels = np.where(names != "", names, keys).tolist()
+    direct = dict(zip(keys, labels))
     suffix: dict[str, str] = {}
-    for _, row in product_df.iterrows():
-        key = str(row.get("prd_key") or "")
-        name = row.get("prd_nm") or ""
-        if not key:
-            continue
-        label = name if name else key
-        direct[key] = label
+    for key, label in zip(keys, labels):
         parts = key.split("-")
         for idx in range(len(parts)):
-            suffix_key = "-".join(parts[idx:])
-            suffix.setdefault(suffix_key, label)
+            suffix.setdefault("-".join(parts[idx:]), label)
     return direct, suffix
 
 
@@ -45,20 +77,66 @@ def resolve_product_name(
     return None
 
 
+def build_product_labels(
+    keys, lookup: tuple[dict[str, str], dict[str, str]]
+) -> dict[str, str]:
+    """Map each product key to its sidebar label, e.g. ``Road-150 Red (BK-R93R-62)``."""
+    labels: dict[str, str] = {}
+    for key in keys:
+        name = resolve_product_name(key, lookup)
+        labels[key] = f"{name} ({key})" if name else key
+    return labels
+
+
+def to_date_ordinals(values) -> np.ndarray:
+    """Days since the Unix epoch as int32; missing dates map to MISSING_DATE_ORDINAL."""
+    days = np.asarray(values, dtype="datetime64[ns]").astype("datetime64[D]")
+    ordinals = days.astype(np.int64)
+    ordinals[np.isnat(days)] = MISSING_DATE_ORDINAL
+    return ordinals.astype(np.int32)
+
+
+def top_n_by(df: pd.DataFrame, column: str, n: int = 5) -> pd.DataFrame:
+    """Top ``n`` values of ``column`` by summed ``sls_sales``, largest first."""
+    totals = df.groupby(column, observed=True)["sls_sales"].sum()
+    return totals.nlargest(n).reset_index()
+
+
+@dataclass(frozen=True)
+class BaselineAggregates:
+    """Full-run totals the KPI deck and change notes compare filtered views against."""
+
+    revenue: float
+    orders: int
+    customers: int
+    top_line_revenue: float
+
+
+def summarize_baseline(enriched: pd.DataFrame) -> BaselineAggregates:
+    """Aggregate an enriched run once; the values do not depend on the active filters."""
+    top_line = top_n_by(enriched, "product_line", 1)
+    return BaselineAggregates(
+        revenue=float(enriched["sls_sales"].sum()),
+        orders=int(enriched["sls_ord_num"].nunique()),
+        customers=int(enriched["sls_cust_id"].nunique()),
+        top_line_revenue=float(top_line["sls_sales"].iloc[0]) if not top_line.empty else 0.0,
+    )
+
+
 def prepare_sales_data(tables: dict[str, pd.DataFrame]) -> tuple[pd.DataFrame, tuple[dict[str, str], dict[str, str]]]:
     """Enrich raw Silver tables with calendar, geography, and product context."""
-    sales = tables["sales"].copy()
-    product = tables["product"].copy()
-    customer = tables["customer"].copy()
-    location = tables["location"].copy()
+    # The tables are shared cached reads: never write to them, derive new frames with assign
+    sales = tables["sales"]
+    product = tables["product"]
+    customer = tables["customer"]
+    location = tables["location"]
 
     date_columns = ["sls_order_dt", "sls_ship_dt", "sls_due_dt"]
-    for column in date_columns:
-        sales[column] = pd.to_datetime(sales[column], errors="coerce")
-
     numeric_columns = ["sls_sales", "sls_price", "sls_quantity"]
-    for column in numeric_columns:
-        sales[column] = pd.to_numeric(sales[column], errors="coerce")
+    sales = sales.assign(
+        **{column: pd.to_datetime(sales[column], errors="coerce") for column in date_columns},
+        **{column: pd.to_numeric(sales[column], errors="coerce") for column in numeric_columns},
+    )
 
     customer = customer.assign(
         location_key=customer["cst_key"]
@@ -72,8 +150,13 @@ def prepare_sales_data(tables: dict[str, pd.DataFrame]) -> tuple[pd.DataFrame, t
         .str.replace("-", "", regex=False)
         .str.upper()
     )
-    loc_map = dict(zip(location["location_key"], location["CNTRY"]))
-    customer["country"] = customer["location_key"].map(loc_map)
+    # Hash join instead of a Python dict; last row per key wins, as the dict did
+    countries = (
+        location[["location_key", "CNTRY"]]
+        .drop_duplicates("location_key", keep="last")
+        .rename(columns={"CNTRY": "country"})
+    )
+    customer = customer.merge(countries, on="location_key", how="left")
     customer = customer.rename(
         columns={
             "cst_gndr": "customer_gender",
@@ -110,7 +193,15 @@ def prepare_sales_data(tables: dict[str, pd.DataFrame]) -> tuple[pd.DataFrame, t
     enriched["country"] = enriched["country"].fillna("Unknown")
 
     enriched["order_dt"] = enriched["sls_order_dt"]
-    enriched["order_date"] = enriched["order_dt"].dt.date
-    enriched["order_day"] = enriched["order_dt"].dt.day_name()
-    enriched["order_week"] = enriched["order_dt"].dt.to_period("W").dt.start_time
+    # Kept as datetime64 (midnight) rather than an object column of datetime.date
+    enriched["order_date"] = enriched["order_dt"].dt.normalize()
+    # dayofweek (Monday=0) doubles as the category code; NaT becomes -1 (missing)
+    weekday_codes = enriched["order_dt"].dt.dayofweek.fillna(-1).astype("int8")
+    enriched["order_day"] = pd.Categorical.from_codes(weekday_codes, dtype=WEEKDAY_DTYPE)
+    # Monday of the order's week, one subtraction instead of a Period round-trip; NaT stays NaT
+    weekday_offsets = pd.to_timedelta(enriched["order_dt"].dt.dayofweek, unit="D")
+    enriched["order_week"] = enriched["order_date"] - weekday_offsets
+    enriched["order_date_ordinal"] = to_date_ordinals(enriched["order_dt"])
+    for column in CATEGORY_COLUMNS:
+        enriched[column] = enriched[column].astype("category")
     return enriched, build_product_lookup(product)
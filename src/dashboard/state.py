@@ -4,6 +4,7 @@ from dataclasses import dataclass
 from typing import Iterable
 
 import pandas as pd
+import streamlit as st
 
 from src.dashboard.services.artifacts import (
     RunLocation,
@@ -12,7 +13,12 @@ from src.dashboard.services.artifacts import (
     load_required_tables,
     load_run_metadata,
 )
-from src.dashboard.services.data_processing import prepare_sales_data
+from src.dashboard.services.data_processing import (
+    BaselineAggregates,
+    build_product_labels,
+    prepare_sales_data,
+    summarize_baseline,
+)
 
 
 @dataclass
@@ -23,13 +29,16 @@ class DashboardState:
     tables: dict[str, pd.DataFrame] | None
     enriched: pd.DataFrame | None
     product_lookup: tuple[dict[str, str], dict[str, str]] | None
+    product_labels: dict[str, str] | None
     missing_info: dict[str, int]
+    baseline: BaselineAggregates | None
     guidance: str
 
 
-def _calculate_missing_info(enriched: pd.DataFrame) -> dict[str, int]:
-    if enriched is None:
-        return {"sales_missing": 0, "price_missing": 0, "quantity_missing": 0}
+@st.cache_data(show_spinner=False, max_entries=16)
+def _calculate_missing_info(run_id: str, _enriched: pd.DataFrame) -> dict[str, int]:
+    """Missing-value counts of a run's enriched frame, cached per run id (the frame is not hashed)."""
+    enriched = _enriched
     return {
         "sales_missing": int(enriched["sls_sales"].isna().sum()),
         "price_missing": int(enriched["sls_price"].isna().sum()),
@@ -37,6 +46,22 @@ def _calculate_missing_info(enriched: pd.DataFrame) -> dict[str, int]:
     }
 
 
+@st.cache_data(show_spinner=False, max_entries=16)
+def _calculate_baseline(run_id: str, _enriched: pd.DataFrame) -> BaselineAggregates:
+    """Full-run KPI aggregates of a run's enriched frame, cached per run id (the frame is not hashed)."""
+    return summarize_baseline(_enriched)
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _enrich_run(
+    run_id: str, data_dir: str, _tables: dict[str, pd.DataFrame]
+) -> tuple[pd.DataFrame, tuple[dict[str, str], dict[str, str]], dict[str, str]]:
+    """Enriched sales frame, product lookup and labels, computed once per run (tables are not hashed)."""
+    enriched, product_lookup = prepare_sales_data(_tables)
+    product_labels = build_product_labels(enriched["sls_prd_key"].dropna().unique(), product_lookup)
+    return enriched, product_lookup, product_labels
+
+
 def build_dashboard_state(
     selected_run_id: str | None = None,
     available_runs: Iterable[RunLocation] | None = None,
@@ -55,18 +80,22 @@ def build_dashboard_state(
     tables: dict[str, pd.DataFrame] | None = None
     enriched: pd.DataFrame | None = None
     product_lookup = None
+    product_labels = None
 
     if selected_run:
         metadata = load_run_metadata(selected_run)
         tables = load_required_tables(selected_run)
         if tables:
-            enriched, product_lookup = prepare_sales_data(tables)
+            enriched, product_lookup, product_labels = _enrich_run(
+                selected_run.run_id, str(selected_run.data_dir), tables
+            )
 
-    missing_info = _calculate_missing_info(enriched) if enriched is not None else {
+    missing_info = _calculate_missing_info(selected_run.run_id, enriched) if enriched is not None else {
         "sales_missing": 0,
         "price_missing": 0,
         "quantity_missing": 0,
     }
+    baseline = _calculate_baseline(selected_run.run_id, enriched) if enriched is not None else None
 
     return DashboardState(
         available_runs=runs,
@@ -75,6 +104,8 @@ def build_dashboard_state(
         tables=tables,
         enriched=enriched,
         product_lookup=product_lookup,
+        product_labels=product_labels,
         missing_info=missing_info,
+        baseline=baseline,
         guidance=guidance,
     )
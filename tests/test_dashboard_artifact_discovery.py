@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import pandas as pd
+
 from src.dashboard.services import artifacts
 
 
@@ -41,3 +43,65 @@ def test_legacy_layout_fallback(monkeypatch, tmp_path):
     assert runs
     assert runs[0].run_id == run_id
     assert runs[0].layout == "legacy"
+
+
+def test_load_csv_parses_sales_dates_and_falls_back_for_ragged_files(tmp_path):
+    sales = tmp_path / "sales_details.csv"
+    sales.write_text(
+        "sls_ord_num,sls_order_dt,sls_ship_dt,sls_due_dt\nSO1,2013-01-01,2013-01-05,\n", encoding="utf-8"
+    )
+    loaded = artifacts._load_csv(sales)
+    assert str(loaded["sls_order_dt"].dtype).startswith("datetime64")
+    assert loaded["sls_due_dt"].isna().all()
+
+    ragged = tmp_path / "LOC_A101.csv"
+    ragged.write_text("CID,CNTRY\nAW-1,Germany\nAW-2\n", encoding="utf-8")
+    assert artifacts._load_csv(ragged)["CID"].tolist() == ["AW-1", "AW-2"]
+
+
+def test_frame_to_csv_bytes_matches_to_csv_byte_for_byte():
+    df = pd.DataFrame(
+        {
+            "country": pd.Categorical(["DE", "FR"]),
+            "product_name": ["Road-150, Red", "Bike"],
+            "sls_sales": [10.5, 20.0],
+            "order_dt": pd.to_datetime(["2013-01-01", "2013-01-02"]),
+        }
+    )
+
+    exported = artifacts.frame_to_csv_bytes(df)
+
+    assert exported == df.to_csv(index=False).encode("utf-8")
+    assert exported == (
+        b"country,product_name,sls_sales,order_dt\n"
+        b'DE,"Road-150, Red",10.5,2013-01-01\n'
+        b"FR,Bike,20.0,2013-01-02\n"
+    )
+
+
+def test_pyarrow_reads_keep_c_engine_dtypes_for_dimension_tables(tmp_path):
+    fixtures = {
+        "prd_info.csv": "prd_id,prd_key,prd_nm,prd_cost,prd_line,prd_start_dt,prd_end_dt\n"
+        "210,CO-RF-FR-R92B-58,HL Road Frame,,R,2003-07-01,\n"
+        "211,CO-RF-FR-R92R-58,HL Road Frame,12,,2003-07-01,2007-12-28\n",
+        "cst_info.csv": "cst_id,cst_key,cst_firstname,cst_lastname,cst_marital_status,cst_gndr,cst_create_date\n"
+        "11000,AW00011000,Jon,Yang,M,M,2025-10-06\n"
+        ",AW00011001,Eugene,Huang,S,,2025-10-06\n",
+        "LOC_A101.csv": "CID,CNTRY\nAW-00011000,Australia\nAW-00011001,\n",
+    }
+    for name, content in fixtures.items():
+        path = tmp_path / name
+        path.write_text(content, encoding="utf-8")
+        options = artifacts.CSV_READ_OPTIONS[name]
+
+        loaded = artifacts._read_csv_pyarrow(path, options)
+
+        pd.testing.assert_frame_equal(loaded, pd.read_csv(path, engine="c", **options))
+        pd.testing.assert_series_equal(loaded.dtypes, pd.read_csv(path, engine="c").dtypes)
+
+    # Pinned types apply while pyarrow converts, so leading zeros survive as in the C parser
+    numeric_looking = tmp_path / "LOC_A101.csv"
+    numeric_looking.write_text("CID,CNTRY,unused\n00123,Germany,\n", encoding="utf-8")
+    loaded = artifacts._read_csv_pyarrow(numeric_looking, artifacts.CSV_READ_OPTIONS["LOC_A101.csv"])
+    pd.testing.assert_frame_equal(loaded, pd.read_csv(numeric_looking, **artifacts.CSV_READ_OPTIONS["LOC_A101.csv"]))
+    assert loaded["CID"].tolist() == ["00123"]
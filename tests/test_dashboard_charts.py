@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from src.dashboard.components.charts import (
+    _daily_revenue,
+    _price_bucket_summary,
+    _product_line_revenue,
+    _weekday_country_revenue,
+    latest_rows,
+)
+from src.dashboard.services.data_processing import to_date_ordinals
+
+
+def test_price_bucket_summary_matches_pd_cut_grouping():
+    rng = np.random.default_rng(7)
+    df = pd.DataFrame(
+        {
+            "sls_ord_num": rng.choice(["SO1", "SO2", "SO3", None], size=200),
+            "sls_price": rng.exponential(100.0, size=200).round(),
+            "sls_quantity": rng.integers(1, 5, size=200).astype(float),
+        }
+    )
+    df.loc[::9, "sls_quantity"] = np.nan
+    valid = df.dropna(subset=["sls_price", "sls_quantity"])
+    expected = (
+        valid.assign(price_bucket=pd.cut(valid["sls_price"], bins=10, include_lowest=True, labels=False))
+        .groupby("price_bucket", as_index=False)
+        .agg(
+            price_mean=("sls_price", "mean"),
+            quantity_median=("sls_quantity", "median"),
+            transactions=("sls_ord_num", "nunique"),
+        )
+    )
+
+    pd.testing.assert_frame_equal(_price_bucket_summary(df), expected, check_dtype=False)
+
+
+def test_price_bucket_summary_handles_empty_and_constant_prices():
+    empty = pd.DataFrame({"sls_ord_num": [], "sls_price": [], "sls_quantity": []})
+    assert _price_bucket_summary(empty).empty
+
+    constant = pd.DataFrame({"sls_ord_num": ["SO1", "SO2", "SO2"], "sls_price": [5.0] * 3, "sls_quantity": [1, 2, 6]})
+    summary = _price_bucket_summary(constant)
+    assert summary[["price_mean", "quantity_median", "transactions"]].values.tolist() == [[5.0, 2.0, 2]]
+
+
+def test_latest_rows_matches_full_sort_with_missing_dates():
+    rng = np.random.default_rng(3)
+    order_dt = pd.Series(pd.to_datetime(rng.integers(0, 50, size=300), unit="D", origin="2013-01-01"))
+    order_dt[rng.choice(300, size=295, replace=False)] = pd.NaT
+    df = pd.DataFrame({"order_dt": order_dt, "sls_ord_num": np.arange(300)})
+
+    for n in (3, 10, 400):
+        expected = df.sort_values("order_dt", ascending=False).head(n)
+        result = latest_rows(df, n)
+        assert result["order_dt"].tolist() == expected["order_dt"].tolist()
+        assert len(set(result["sls_ord_num"])) == len(result)
+
+
+def test_daily_revenue_skips_missing_dates_and_sales():
+    order_dt = pd.to_datetime(["2013-01-02 10:00", "2013-01-01 09:00", "2013-01-02 18:00", None, "2013-01-03 08:00"])
+    df = pd.DataFrame({"order_dt": order_dt, "sls_sales": [10.0, 5.0, 2.5, 100.0, np.nan]})
+    df["order_date_ordinal"] = to_date_ordinals(df["order_dt"])
+
+    daily = _daily_revenue(df)
+
+    assert daily["order_date"].astype(str).tolist() == ["2013-01-01", "2013-01-02"]
+    assert daily["sls_sales"].tolist() == [5.0, 12.5]
+
+
+def test_product_mix_and_heatmap_share_one_pass_per_view():
+    df = pd.DataFrame(
+        {
+            "order_day": ["Friday", "Monday", "Monday", None, "Friday"],
+            "country": pd.Categorical(["France", "Germany", "Germany", "Germany", "Spain"]),
+            "product_line": pd.Categorical(["Road", "Road", "Mountain", "Touring", "Touring"]),
+            "sls_sales": [10.0, 20.0, 5.0, 7.0, np.nan],
+        }
+    )
+
+    lines = _product_line_revenue(df)
+    assert lines["product_line"].tolist() == ["Mountain", "Road", "Touring"]
+    assert lines["sls_sales"].tolist() == [5.0, 30.0, 7.0]
+
+    heatmap = _weekday_country_revenue(df)
+    assert heatmap.index.tolist() == ["Monday", "Friday"]
+    assert heatmap.columns.tolist() == ["France", "Germany"]
+    assert heatmap.to_numpy().tolist() == [[0.0, 25.0], [10.0, 0.0]]
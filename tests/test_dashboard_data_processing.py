@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import pandas as pd
+
+from src.dashboard.services.artifacts import frame_to_csv_bytes
+from src.dashboard.services.data_processing import (
+    build_product_labels,
+    build_product_lookup,
+    parse_iso_timestamp,
+    parse_iso_timestamp_series,
+    prepare_sales_data,
+    top_n_by,
+)
+
+
+def test_product_labels_resolve_direct_and_suffix_keys():
+    product = pd.DataFrame(
+        {
+            "prd_key": ["CO-RF-FR-R92B-58", "BK-M68B-38", None],
+            "prd_nm": ["HL Road Frame - Black- 58", "Mountain-200 Black- 38", "Orphan"],
+        }
+    )
+    lookup = build_product_lookup(product)
+
+    labels = build_product_labels(["CO-RF-FR-R92B-58", "FR-R92B-58", "BK-M68B-38", "XX-1"], lookup)
+
+    assert labels == {
+        "CO-RF-FR-R92B-58": "HL Road Frame - Black- 58 (CO-RF-FR-R92B-58)",
+        "FR-R92B-58": "HL Road Frame - Black- 58 (FR-R92B-58)",
+        "BK-M68B-38": "Mountain-200 Black- 38 (BK-M68B-38)",
+        "XX-1": "XX-1",
+    }
+
+
+def test_product_lookup_skips_missing_keys_and_labels_unnamed_products_by_key():
+    product = pd.DataFrame({"prd_key": ["AC-HE-HL-U509", None, "BK-R93R-62"], "prd_nm": [None, "Orphan", "Road-150"]})
+
+    direct, suffix = build_product_lookup(product)
+
+    assert direct == {"AC-HE-HL-U509": "AC-HE-HL-U509", "BK-R93R-62": "Road-150"}
+    assert suffix["U509"] == "AC-HE-HL-U509"
+    assert suffix["R93R-62"] == "Road-150"
+    assert "nan" not in direct and "nan" not in suffix
+
+
+def test_parse_iso_timestamp_series_matches_scalar_parser():
+    values = ["2026-01-25T21:48:00Z", "2026-01-25T21:48:00.123+02:00", None, "not a timestamp"]
+
+    parsed = parse_iso_timestamp_series(pd.Series(values))
+
+    assert parsed.iloc[0] == parse_iso_timestamp(values[0])
+    assert parsed.iloc[1] == parse_iso_timestamp(values[1])
+    assert parsed.iloc[2:].isna().all()
+
+
+def test_prepare_sales_data_joins_country_once_per_customer():
+    tables = {
+        "sales": pd.DataFrame(
+            {
+                "sls_ord_num": ["SO1", "SO2"],
+                "sls_prd_key": ["BK-1", "BK-1"],
+                "sls_cust_id": [1, 2],
+                "sls_order_dt": ["2024-01-04", None],
+                "sls_ship_dt": ["2024-01-03", None],
+                "sls_due_dt": ["2024-01-05", None],
+                "sls_sales": [10, 20],
+                "sls_quantity": [1, 2],
+                "sls_price": [10, 10],
+            }
+        ),
+        "product": pd.DataFrame({"prd_key": ["BK-1"], "prd_nm": ["Bike"], "prd_line": ["R"], "prd_cost": [5]}),
+        "customer": pd.DataFrame(
+            {"cst_id": [1, 2], "cst_key": ["AW-1", "AW-2"], "cst_gndr": ["F", None], "cst_marital_status": ["S", "M"]}
+        ),
+        "location": pd.DataFrame({"CID": ["AW-1", "AW1", "AW-3"], "CNTRY": ["France", "Germany", "Spain"]}),
+    }
+
+    enriched, _ = prepare_sales_data(tables)
+
+    assert enriched["country"].tolist() == ["Germany", "Unknown"]
+    assert enriched["customer_gender"].tolist() == ["F", "Unspecified"]
+    assert "country" not in tables["customer"]
+    assert enriched["order_date"].iloc[0] == pd.Timestamp("2024-01-04")
+    assert enriched["order_week"].iloc[0] == pd.Timestamp("2024-01-01")
+    assert enriched[["order_date", "order_week"]].iloc[1].isna().all()
+    # Exports still write plain dates, byte-identical to the former datetime.date column
+    legacy = enriched[["order_date", "order_week"]].assign(order_date=enriched["order_dt"].dt.date)
+    assert frame_to_csv_bytes(enriched[["order_date", "order_week"]]) == frame_to_csv_bytes(legacy)
+    assert frame_to_csv_bytes(enriched[["order_date", "order_week"]]).splitlines()[1] == b"2024-01-04,2024-01-01"
+
+
+def test_top_n_by_sums_sales_and_keeps_largest_first():
+    df = pd.DataFrame({"country": pd.Categorical(["DE", "FR", "DE", "US"]), "sls_sales": [5.0, 7.0, 4.0, 1.0]})
+
+    top = top_n_by(df, "country", n=2)
+
+    assert top["country"].tolist() == ["DE", "FR"]
+    assert top["sls_sales"].tolist() == [9.0, 7.0]
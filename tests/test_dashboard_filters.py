@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+from src.dashboard.components import filters as dashboard_filters
+from src.dashboard.components.filters import apply_filters
+from src.dashboard.services.data_processing import CATEGORY_COLUMNS, to_date_ordinals
+
+
+def _enriched() -> pd.DataFrame:
+    df = pd.DataFrame(
+        {
+            "sls_ord_num": ["SO1", "SO2", "SO3", "SO4", "SO5"],
+            "order_dt": pd.to_datetime(["2013-01-01 08:30", "2013-01-02 00:00", None, "2013-01-03 00:00", "2013-01-04 00:00"]),
+            "product_line": ["Road", "Mountain", "Road", "Road", "Other"],
+            "sls_prd_key": ["BK-1", "BK-2", "BK-1", np.nan, "BK-3"],
+            "country": ["Germany", "France", "Germany", "Germany", "Unknown"],
+            "customer_gender": ["F", "M", "F", "F", "Unspecified"],
+            "customer_marital_status": ["M", "S", "M", "M", "Unspecified"],
+            "sls_sales": [100.0, 200.0, 300.0, 400.0, np.nan],
+            "sls_price": [100.0, 200.0, 300.0, 400.0, 50.0],
+            "sls_quantity": [1, 1, 1, 1, 1],
+        }
+    )
+    return df.assign(order_date_ordinal=to_date_ordinals(df["order_dt"]))
+
+
+def _all_filters(df: pd.DataFrame) -> dict:
+    return {
+        "date_range": (date(2013, 1, 1), date(2013, 1, 4)),
+        "product_lines": sorted(df["product_line"].unique()),
+        "product_keys": sorted(df["sls_prd_key"].dropna().unique()),
+        "countries": sorted(df["country"].unique()),
+        "genders": sorted(df["customer_gender"].unique()),
+        "marital_status": sorted(df["customer_marital_status"].unique()),
+        "sales_range": (0.0, 1000.0),
+        "price_range": (0.0, 1000.0),
+        "quantity_range": (0.0, 10.0),
+    }
+
+
+def test_apply_filters_drops_missing_dates_keys_and_sales():
+    df = _enriched()
+    filtered = apply_filters(df, _all_filters(df))
+    assert filtered["sls_ord_num"].tolist() == ["SO1", "SO2"]
+
+
+def test_apply_filters_date_bounds_are_inclusive_days():
+    df = _enriched()
+    filters = _all_filters(df) | {"date_range": (date(2013, 1, 1), date(2013, 1, 1))}
+    assert apply_filters(df, filters)["sls_ord_num"].tolist() == ["SO1"]
+
+
+def test_apply_filters_combines_membership_and_ranges():
+    df = _enriched()
+    filters = _all_filters(df) | {"countries": ["Germany"], "sales_range": (150.0, 1000.0)}
+    assert apply_filters(df, filters).empty
+    filters = _all_filters(df) | {"product_lines": ["Mountain"], "price_range": (150.0, 250.0)}
+    assert apply_filters(df, filters)["sls_ord_num"].tolist() == ["SO2"]
+
+
+def test_apply_filters_matches_codes_on_categorical_columns():
+    df = _enriched()
+    categorical = df.astype({column: "category" for column in CATEGORY_COLUMNS if column in df})
+    filters = _all_filters(df) | {"countries": ["Germany", "Atlantis"], "product_keys": ["BK-1", "BK-2"]}
+    filtered = apply_filters(categorical, filters)
+    assert filtered["sls_ord_num"].tolist() == apply_filters(df, filters)["sls_ord_num"].tolist() == ["SO1"]
+
+
+def test_apply_filters_skips_full_selections_but_still_drops_missing_keys():
+    df = _enriched()
+    categorical = df.astype({column: "category" for column in CATEGORY_COLUMNS if column in df})
+    filters = _all_filters(categorical)
+    assert dashboard_filters._isin_mask(categorical["country"], filters["countries"]) is None
+    assert dashboard_filters._isin_mask(categorical["sls_prd_key"], filters["product_keys"]) is not None
+    assert apply_filters(categorical, filters)["sls_ord_num"].tolist() == ["SO1", "SO2"]
+
+
+def test_apply_filters_cached_reuses_view_per_run_and_filters(monkeypatch):
+    monkeypatch.setattr(dashboard_filters.st, "session_state", {})
+    monkeypatch.setattr(dashboard_filters, "FILTER_CACHE_MAX_ENTRIES", 2)
+    df = _enriched()
+    filters = _all_filters(df)
+
+    first = dashboard_filters.apply_filters_cached(df, filters, "run-a")
+    assert dashboard_filters.apply_filters_cached(_enriched(), dict(filters), "run-a") is first
+    assert dashboard_filters.apply_filters_cached(df, filters, "run-b") is not first
+    narrowed = filters | {"countries": ["France"]}
+    assert dashboard_filters.apply_filters_cached(df, narrowed, "run-a")["sls_ord_num"].tolist() == ["SO2"]
+    assert dashboard_filters.apply_filters_cached(df, filters, "run-a") is not first
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import pandas as pd
+
+from src.dashboard.components import kpis
+from src.dashboard.services.data_processing import summarize_baseline
+
+
+def _sales(lines: list[str], sales: list[float]) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "product_line": lines,
+            "sls_sales": sales,
+            "sls_ord_num": [f"SO{i % 2}" for i in range(len(lines))],
+            "sls_cust_id": [1] * len(lines),
+        }
+    )
+
+
+def test_summarize_changes_compares_against_precomputed_baseline():
+    baseline = _sales(["Road", "Road", "Mountain"], [50.0, 25.0, 25.0])
+    filtered = baseline.iloc[[0, 2]]
+
+    assert kpis.summarize_changes(filtered, summarize_baseline(baseline)) == [
+        "Revenue view is -25€ (-25.0%) vs. the full run.",
+        "Top line 'Road' contributes 66.7% of filtered revenue vs 75.0% baseline.",
+    ]
+
+
+def test_summarize_baseline_counts_distinct_orders_and_customers():
+    aggregates = summarize_baseline(_sales(["Road", "Road", "Mountain"], [10.0, 5.0, 5.0]))
+
+    assert (aggregates.revenue, aggregates.orders, aggregates.customers) == (20.0, 2, 1)
+    assert aggregates.top_line_revenue == 15.0
+    assert kpis._deck_totals(_sales([], [])) == (0.0, 0, 0)
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+from pathlib import Path
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+
+from src.agents import business_insights_agent as insights_agent
+
+
+def _write_gold_fixture(gold_data_dir: Path) -> None:
+    gold_data_dir.mkdir(parents=True)
+    pd.DataFrame(
+        {
+            "customer_id": [1, 2, 3, 4],
+            "country": ["DE", "DE", "FR", "US"],
+            "gender": ["F", "M", "F", "F"],
+        }
+    ).to_csv(gold_data_dir / "gold_dim_customer.csv", index=False)
+    pd.DataFrame({"sales_amount": [10.0, 20.0, 30.0, 40.0], "quantity": [1, 1, 2, 2]}).to_csv(
+        gold_data_dir / "gold_fact_sales.csv", index=False
+    )
+
+
+@pytest.mark.unit
+def test_analyze_data_samples_computes_customer_and_revenue_metrics(tmp_path: Path) -> None:
+    gold_data_dir = tmp_path / "data"
+    _write_gold_fixture(gold_data_dir)
+
+    insights = insights_agent.analyze_data_samples(gold_data_dir)
+
+    assert insights["total_customers"] == 4
+    assert insights["geographic_coverage"]["countries_covered"] == 3
+    assert insights["geographic_coverage"]["top_markets"] == {"DE": 2, "FR": 1, "US": 1}
+    assert insights["geographic_coverage"]["market_concentration"] == "50.0%"
+    assert insights["customer_segments"]["gender_split"] == {"F": 3, "M": 1}
+    assert insights["total_sales_records"] == 4
+    assert insights["revenue_metrics"]["total_revenue"] == 100.0
+    assert insights["revenue_metrics"]["avg_transaction_value"] == 25.0
+    assert insights["revenue_metrics"]["max_transaction"] == 40.0
+    assert insights["revenue_metrics"]["revenue_concentration"] == "34.0%"
+    assert insights["data_quality_score"] == 50.0
+
+
+@pytest.mark.unit
+def test_read_gold_columns_keeps_row_count_without_matching_columns(tmp_path: Path) -> None:
+    path = tmp_path / "table.csv"
+    pd.DataFrame({"a": [1, 2, 3], "b": [4, 5, 6]}).to_csv(path, index=False)
+
+    df = insights_agent.read_gold_columns(path, ["missing"])
+
+    assert len(df) == 3
+
+
+@pytest.mark.unit
+def test_expected_chart_files_match_rendered_charts(tmp_path: Path) -> None:
+    gold_data_dir = tmp_path / "data"
+    _write_gold_fixture(gold_data_dir)
+    pd.DataFrame({"customer_segment": ["A", "B"], "total_sales": [10.0, 20.0], "customer_count": [1, 2]}).to_csv(
+        gold_data_dir / "gold_agg_exec_kpis.csv", index=False
+    )
+
+    chart_files = insights_agent.create_business_charts(gold_data_dir, tmp_path / "charts")
+
+    assert chart_files == insights_agent.expected_chart_files(gold_data_dir)
+    assert all((tmp_path / "charts" / name).exists() for name in chart_files)
+
+
+@pytest.mark.unit
+def test_team_report_prompts_share_static_prefix() -> None:
+    inputs = insights_agent.ReportInputs("run", {"status": "success"}, {"total_customers": 4}, ["chart.png"])
+
+    marketing = insights_agent.build_team_report_messages("Marketing", inputs)
+    finance = insights_agent.build_team_report_messages("Finance", inputs)
+
+    assert marketing[0] == finance[0]
+    shared_prefix, marketing_tail = marketing[1]["content"].split("---\nDepartment:")
+    assert finance[1]["content"].startswith(shared_prefix)
+    assert inputs.insights_json in shared_prefix
+    assert "Marketing" in marketing_tail and "Marketing" not in shared_prefix
+
+
+class _FakeCompletions:
+    def __init__(self, answers: dict[str, str]) -> None:
+        self.answers = answers
+        self.models: list[str] = []
+        self.max_tokens: list[int] = []
+
+    def create(self, **request):
+        self.models.append(request["model"])
+        self.max_tokens.append(request["max_tokens"])
+        message = SimpleNamespace(content=self.answers[request["model"]])
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)], usage=None)
+
+
+@pytest.mark.unit
+def test_team_report_falls_back_when_sections_are_missing() -> None:
+    complete_report = "\n".join(insights_agent.TEAM_REPORT_SECTIONS)
+    completions = _FakeCompletions(
+        {
+            insights_agent.TEAM_REPORT_MODEL: "# SALES TEAM REPORT\n\nToo short.",
+            insights_agent.TEAM_REPORT_FALLBACK_MODEL: complete_report,
+        }
+    )
+    client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+    inputs = insights_agent.ReportInputs("run", {}, {"total_customers": 4})
+
+    report, _ = insights_agent._generate_team_report(
+        client, "Sales", inputs, insights_agent.TEAM_REPORT_MODEL, None
+    )
+
+    assert report == complete_report
+    assert completions.models == [insights_agent.TEAM_REPORT_MODEL, insights_agent.TEAM_REPORT_FALLBACK_MODEL]
+    assert completions.max_tokens == [insights_agent.TEAM_REPORT_MAX_TOKENS, insights_agent.TEAM_REPORT_FALLBACK_MAX_TOKENS]
+    assert insights_agent.TEAM_REPORT_FALLBACK_MAX_TOKENS > insights_agent.TEAM_REPORT_MAX_TOKENS
+
+
+@pytest.mark.unit
+def test_call_chat_completion_rejects_prompt_over_context_window() -> None:
+    completions = _FakeCompletions({})
+    client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+    oversized = "x" * (insights_agent.MODEL_CONTEXT_TOKENS["gpt-4o-mini"] * insights_agent.PROMPT_CHARS_PER_TOKEN)
+
+    with pytest.raises(ValueError, match="context window"):
+        insights_agent.call_chat_completion(
+            client,
+            "test",
+            model_name="gpt-4o-mini",
+            messages=[{"role": "user", "content": oversized}],
+            temperature=0.0,
+            max_tokens=100,
+        )
+
+    assert completions.models == []
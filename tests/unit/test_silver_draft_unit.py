@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.agents import load_2_silver_layer_draft_agent as draft_agent
+
+
+@pytest.mark.unit
+def test_profile_table_reports_nulls_trim_and_keys() -> None:
+    df = pd.DataFrame(
+        {
+            "cst_key": ["AW001", "AW002", "AW003", "AW004"],
+            "cst_gndr": [" M", "F", "", None],
+            "mixed": ["a", 1, "b", None],
+        }
+    )
+
+    profile = draft_agent._profile_table(df, "cst_info.csv")
+
+    assert profile["null_counts"] == {"cst_key": 0, "cst_gndr": 2, "mixed": 1}
+    assert "Trim whitespace in cst_gndr." in profile["suggested_silver_transforms"]
+    assert "Trim whitespace in cst_key." not in profile["suggested_silver_transforms"]
+    assert profile["key_candidates"] == [{"column": "cst_key", "reason": "unique_non_null"}]
+
+
+@pytest.mark.unit
+def test_infer_series_type_only_inspects_head_slice(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(draft_agent, "INFER_MAX_ROWS", 3)
+    series = pd.Series([None, None, None, "1", "2"], dtype=object)
+
+    assert draft_agent._infer_series_type(series) == "unknown"
+    assert draft_agent._infer_series_type(series.iloc[::-1].reset_index(drop=True)) == "integer"
+
+
+@pytest.mark.unit
+def test_profile_bronze_run_in_worker_processes(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(draft_agent, "PROFILE_MAX_WORKERS", 2)
+    monkeypatch.setattr(draft_agent, "PROFILE_PARALLEL_MIN_BYTES", 0)
+    pd.DataFrame({"id": [1, 2, 3]}).to_csv(tmp_path / "a.csv", index=False)
+    (tmp_path / "b.csv").write_text("", encoding="utf-8")
+
+    profile = draft_agent._profile_bronze_run(tmp_path)
+
+    assert profile["tables"]["a.csv"]["row_count"] == 3
+    assert profile["errors"] == [{"file": "b.csv", "error": profile["tables"]["b.csv"]["error"]}]
+    assert profile["schema_overview"]["table_count"] == 2
+
+
+@pytest.mark.unit
+def test_profile_csv_by_column_matches_full_read(tmp_path: Path) -> None:
+    csv_path = tmp_path / "sales_details.csv"
+    pd.DataFrame(
+        {
+            "sls_ord_num": ["SO1", "SO1", "SO2", "SO3", None],
+            "sls_prd_key": [" BK-1", " BK-1", "BK-2", "BK-3", "BK-4"],
+            "sls_quantity": [1, 1, 2, 3, 2],
+            "sls_price": [2, 2, 3, 2, 1],
+        }
+    ).to_csv(csv_path, index=False)
+
+    profile = draft_agent._profile_csv_by_column(csv_path)
+
+    assert profile == draft_agent._profile_table(pd.read_csv(csv_path), csv_path.name)
+    assert profile["duplicate_rows"] == 1
+
+
+@pytest.mark.unit
+def test_profile_csv_by_column_reads_blocks_and_confirms_hash_collisions(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    csv_path = tmp_path / "sales_details.csv"
+    df = pd.DataFrame(
+        {
+            "sls_ord_num": ["SO1", "SO1", "SO2", "SO3", None, None],
+            "sls_prd_key": ["BK-1", "BK-1", "BK-2", "BK-3", "BK-4", "BK-4"],
+            "sls_quantity": [1, 1, 2, 3, 2, 2],
+            "sls_price": [2, 2, 3, 2, 1, 1],
+        }
+    )
+    df.to_csv(csv_path, index=False)
+    # Two columns per pass, and every row hashes alike so all rows are duplicate candidates
+    monkeypatch.setattr(draft_agent, "PROFILE_COLUMN_BLOCK_BYTES", csv_path.stat().st_size // 2 + 1)
+    monkeypatch.setattr(draft_agent, "_column_hashes", lambda series: np.zeros(len(series), dtype=np.uint64))
+    read_columns: list[list[int]] = []
+    read_csv = pd.read_csv
+    monkeypatch.setattr(
+        draft_agent.pd, "read_csv", lambda path, **kwargs: read_columns.append(kwargs.get("usecols")) or read_csv(path, **kwargs)
+    )
+
+    profile = draft_agent._profile_csv_by_column(csv_path)
+
+    assert read_columns == [None, [0, 1], [2, 3], [0, 1], [2, 3]]
+    assert profile["duplicate_rows"] == int(df.duplicated().sum()) == 2
+    assert profile["null_counts"] == draft_agent._profile_table(df, csv_path.name)["null_counts"]
+
+
+@pytest.mark.unit
+def test_profile_bronze_run_reuses_cache_for_unchanged_files(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    pd.DataFrame({"id": [1, 2, 3]}).to_csv(data_dir / "a.csv", index=False)
+    pd.DataFrame({"id": [4, 5]}).to_csv(data_dir / "b.csv", index=False)
+    cache_path = tmp_path / draft_agent.PROFILE_CACHE_NAME
+
+    first = draft_agent._profile_bronze_run(data_dir, cache_path)
+    pd.DataFrame({"id": [6]}).to_csv(data_dir / "b.csv", index=False)
+    profiled: list[str] = []
+    read_and_profile = draft_agent._read_and_profile
+    monkeypatch.setattr(
+        draft_agent, "_read_and_profile", lambda path_str: profiled.append(Path(path_str).name) or read_and_profile(path_str)
+    )
+    second = draft_agent._profile_bronze_run(data_dir, cache_path)
+
+    assert profiled == ["b.csv"]
+    assert second["tables"]["a.csv"] == first["tables"]["a.csv"]
+    assert second["tables"]["b.csv"]["row_count"] == 1
+    assert list(second["tables"]) == ["a.csv", "b.csv"]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ("values", "expected"),
+    [
+        (["Jan 5, 2020", "Feb 6, 2021"], "datetime"),
+        (["05.01.2020", "06.02.2021"], "datetime"),
+        (["12:30", "13:45"], "datetime"),
+        (["BK-R93R-62", "CO-RF-FR-R92B-58"], "string"),
+        (["1.5", "2"], "float"),
+    ],
+)
+def test_infer_series_type_keeps_unformatted_datetimes(values: list[str], expected: str) -> None:
+    assert draft_agent._infer_series_type(pd.Series(values * 10, dtype=object)) == expected
+
+
+class _FakeBatchClient:
+    def __init__(self, content: str) -> None:
+        self.content = content
+        self.submitted: list[dict] = []
+        self.files = SimpleNamespace(create=self._create_file, content=self._file_content)
+        self.batches = SimpleNamespace(create=self._create_batch, retrieve=None)
+
+    def _create_file(self, file, purpose):
+        self.submitted.append(json.loads(file[1]))
+        return SimpleNamespace(id="file-in")
+
+    def _create_batch(self, **_kwargs):
+        return SimpleNamespace(id="batch-1", status="completed", output_file_id="file-out")
+
+    def _file_content(self, _file_id):
+        record = {
+            "custom_id": self.submitted[0]["custom_id"],
+            "response": {
+                "status_code": 200,
+                "body": {
+                    "choices": [{"message": {"content": self.content}}],
+                    "usage": {"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15},
+                },
+            },
+        }
+        return SimpleNamespace(text=json.dumps(record))
+
+
+@pytest.mark.unit
+def test_human_report_uses_batch_api_when_enabled() -> None:
+    client = _FakeBatchClient("# Silver report")
+
+    report = draft_agent._generate_human_report_with_retry(
+        client, "gpt-4.1-mini", "bronze", "silver", "", "", "", {}, use_batch_api=True
+    )
+
+    assert report == "# Silver report"
+    assert client.submitted[0]["url"] == "/v1/chat/completions"
+    assert client.submitted[0]["body"]["model"] == "gpt-4.1-mini"
+
+
+class _FakeStreamingCompletions:
+    def __init__(self, deltas: list[str]) -> None:
+        self.deltas = deltas
+        self.requests: list[dict] = []
+
+    def create(self, **request):
+        self.requests.append(request)
+        chunks = [SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=d))], usage=None) for d in self.deltas]
+        usage = SimpleNamespace(prompt_tokens=10, completion_tokens=2, total_tokens=12, prompt_tokens_details=None)
+        return iter([*chunks, SimpleNamespace(choices=[], usage=usage)])
+
+
+@pytest.mark.unit
+def test_human_report_streams_into_output_file(tmp_path: Path) -> None:
+    completions = _FakeStreamingCompletions(["# Silver ", "report"])
+    client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+    output_path = tmp_path / "silver_run_human_report.md"
+
+    report = draft_agent._generate_human_report_with_retry(
+        client, "gpt-4.1-mini", "bronze", "silver", "", "", "", {}, output_path=output_path
+    )
+
+    assert report == "# Silver report"
+    assert output_path.read_text(encoding="utf-8") == "# Silver report"
+    assert completions.requests[0]["stream"] is True
+
+
+class _FailingCompletions:
+    def __init__(self, failures: int, content: str) -> None:
+        self.failures = failures
+        self.content = content
+
+    def create(self, **_request):
+        if self.failures:
+            self.failures -= 1
+            raise RuntimeError("rate limited")
+        message = SimpleNamespace(content=self.content)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)], usage=None)
+
+
+@pytest.mark.unit
+def test_human_report_retries_with_jittered_backoff(monkeypatch: pytest.MonkeyPatch) -> None:
+    sleeps: list[float] = []
+    monkeypatch.setattr(draft_agent.time, "sleep", sleeps.append)
+    monkeypatch.setattr(draft_agent.random, "random", lambda: 0.25)
+    client = SimpleNamespace(chat=SimpleNamespace(completions=_FailingCompletions(2, "# Silver report")))
+
+    report = draft_agent._generate_human_report_with_retry(client, "gpt-4.1-mini", "bronze", "silver", "", "", "", {})
+
+    assert report == "# Silver report"
+    assert sleeps == [1.25, 2.25]